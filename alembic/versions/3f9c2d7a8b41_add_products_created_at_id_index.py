@@ -0,0 +1,32 @@
+"""add products created_at id index
+
+Revision ID: 3f9c2d7a8b41
+Revises: a4ea230540e1
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2d7a8b41'
+down_revision: Union[str, None] = 'a4ea230540e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_products_created_at_id',
+        'products',
+        ['created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_created_at_id', table_name='products')
@@ -0,0 +1,56 @@
+"""add cart_items cart_id product_id unique
+
+Revision ID: 8d1e4b6c2f93
+Revises: 3f9c2d7a8b41
+Create Date: 2026-10-18 17:41:05.532871
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8d1e4b6c2f93'
+down_revision: Union[str, None] = '3f9c2d7a8b41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fold duplicate lines into the oldest one before the constraint goes on.
+    op.execute(
+        """
+        WITH ranked AS (
+            SELECT
+                id,
+                row_number() OVER (
+                    PARTITION BY cart_id, product_id ORDER BY created_at, id
+                ) AS position,
+                sum(quantity) OVER (PARTITION BY cart_id, product_id) AS total
+            FROM cart_items
+        ),
+        merged AS (
+            UPDATE cart_items
+            SET quantity = ranked.total
+            FROM ranked
+            WHERE cart_items.id = ranked.id
+              AND ranked.position = 1
+              AND cart_items.quantity <> ranked.total
+        )
+        DELETE FROM cart_items
+        USING ranked
+        WHERE cart_items.id = ranked.id AND ranked.position > 1
+        """
+    )
+    op.create_unique_constraint(
+        'uq_cart_items_cart_id_product_id',
+        'cart_items',
+        ['cart_id', 'product_id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_cart_items_cart_id_product_id', 'cart_items', type_='unique')
@@ -0,0 +1,47 @@
+"""add product rating aggregates
+
+Revision ID: b7e2f5a9c310
+Revises: 8d1e4b6c2f93
+Create Date: 2026-10-18 18:02:47.905163
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2f5a9c310'
+down_revision: Union[str, None] = '8d1e4b6c2f93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RATING_STAR_COLUMNS = [f'rating_star_{star}' for star in range(1, 6)]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows start at zero; run `python -m app.commands.backfill_ratings`
+    # once after upgrading to fill them from the reviews table.
+    op.add_column(
+        'products',
+        sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column(
+        'products',
+        sa.Column('rating_sum', sa.Double(), server_default='0', nullable=False),
+    )
+    for name in RATING_STAR_COLUMNS:
+        op.add_column(
+            'products',
+            sa.Column(name, sa.Integer(), server_default='0', nullable=False),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in reversed(RATING_STAR_COLUMNS):
+        op.drop_column('products', name)
+    op.drop_column('products', 'rating_sum')
+    op.drop_column('products', 'rating_count')
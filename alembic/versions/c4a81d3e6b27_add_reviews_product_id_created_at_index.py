@@ -0,0 +1,32 @@
+"""add reviews product_id created_at index
+
+Revision ID: c4a81d3e6b27
+Revises: b7e2f5a9c310
+Create Date: 2026-10-18 18:24:13.407719
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a81d3e6b27'
+down_revision: Union[str, None] = 'b7e2f5a9c310'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_reviews_product_id_created_at',
+        'reviews',
+        ['product_id', 'created_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reviews_product_id_created_at', table_name='reviews')
@@ -0,0 +1,49 @@
+"""add product listing filter indexes
+
+Revision ID: e5b8c1f4a697
+Revises: d9f3a7c5e214
+Create Date: 2026-10-18 20:11:37.604218
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c1f4a697'
+down_revision: Union[str, None] = 'd9f3a7c5e214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_products_category_id_created_at_id',
+        'products',
+        ['category_id', 'created_at', 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_products_active_category_id_price',
+        'products',
+        ['category_id', 'price', 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'ix_products_active_price_id',
+        'products',
+        ['price', 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_products_active_price_id', table_name='products')
+    op.drop_index('ix_products_active_category_id_price', table_name='products')
+    op.drop_index('ix_products_category_id_created_at_id', table_name='products')
@@ -0,0 +1,51 @@
+"""add server defaults for ids and timestamps
+
+Revision ID: f2c6d8a1b357
+Revises: e5b8c1f4a697
+Create Date: 2026-10-18 22:04:51.318920
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c6d8a1b357'
+down_revision: Union[str, None] = 'e5b8c1f4a697'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMPED_TABLES = (
+    'addresses',
+    'carts',
+    'cart_items',
+    'categories',
+    'coupons',
+    'orders',
+    'payments',
+    'products',
+    'reviews',
+    'shipments',
+    'users',
+)
+TABLES = TIMESTAMPED_TABLES + ('order_items',)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+    for table in TIMESTAMPED_TABLES:
+        op.alter_column(table, 'created_at', server_default=sa.text('now()'))
+        op.alter_column(table, 'updated_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TIMESTAMPED_TABLES:
+        op.alter_column(table, 'updated_at', server_default=None)
+        op.alter_column(table, 'created_at', server_default=None)
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,90 @@
+"""Command line entrypoint.
+
+python -m app serve --workers 4 --port 8000
+
+Workers are separate processes that each import the app and build their own
+database engines and log sinks in the lifespan hook, so nothing with an open
+socket or a writer thread is shared across processes. On SIGTERM uvicorn
+stops accepting connections and waits up to SHUTDOWN_DRAIN_TIMEOUT for
+in-flight requests before the lifespan shutdown closes the pools.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+
+import uvicorn
+from dotenv import load_dotenv
+
+load_dotenv()
+
+APP = "app.main:app"
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", 8000))
+WEB_CONCURRENCY = os.getenv("WEB_CONCURRENCY")
+SHUTDOWN_DRAIN_TIMEOUT = float(os.getenv("SHUTDOWN_DRAIN_TIMEOUT", 25))
+
+
+def cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_workers() -> int:
+    if WEB_CONCURRENCY:
+        return int(WEB_CONCURRENCY)
+    return cpu_count()
+
+
+def prepare_metrics_dir(workers: int) -> None:
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if workers > 1 and not directory:
+        directory = tempfile.mkdtemp(prefix="prometheus-")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+
+
+def serve(args: argparse.Namespace) -> None:
+    prepare_metrics_dir(args.workers)
+    uvicorn.run(
+        APP,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop="uvloop",
+        http="httptools",
+        lifespan="on",
+        timeout_graceful_shutdown=SHUTDOWN_DRAIN_TIMEOUT,
+        log_level=args.log_level,
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="Run the API with uvicorn")
+    serve_parser.add_argument("--host", default=HOST)
+    serve_parser.add_argument("--port", type=int, default=PORT)
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help="Worker processes; defaults to WEB_CONCURRENCY or the usable CPUs",
+    )
+    serve_parser.add_argument("--log-level", default="info")
+    serve_parser.set_defaults(handler=serve)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
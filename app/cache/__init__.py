@@ -0,0 +1,34 @@
+import os
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from .backend import CacheBackend, CacheStats, InMemoryCache, RedisCache
+
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL")
+
+_cache: Optional[CacheBackend] = None
+
+
+def get_cache() -> CacheBackend:
+    global _cache
+    if _cache is None:
+        _cache = RedisCache(REDIS_URL) if REDIS_URL else InMemoryCache()
+    return _cache
+
+
+def set_cache(cache: CacheBackend) -> None:
+    global _cache
+    _cache = cache
+
+
+__all__ = [
+    "CacheBackend",
+    "CacheStats",
+    "InMemoryCache",
+    "RedisCache",
+    "get_cache",
+    "set_cache",
+]
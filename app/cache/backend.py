@@ -0,0 +1,99 @@
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.configs.logger import logger
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+
+
+class CacheBackend(ABC):
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self._get(key)
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    @abstractmethod
+    async def _get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: int) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+
+class InMemoryCache(CacheBackend):
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, bytes]] = {}
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.max_entries:
+            oldest = next(iter(self._entries))
+            del self._entries[oldest]
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisCache(CacheBackend):
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        self.client = Redis.from_url(url)
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        try:
+            return await self.client.get(key)
+        except RedisError as e:
+            self.stats.errors += 1
+            logger.warning(f"Cache get failed for {key}: {e}")
+            return None
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        try:
+            await self.client.set(key, value, ex=ttl)
+        except RedisError as e:
+            self.stats.errors += 1
+            logger.warning(f"Cache set failed for {key}: {e}")
+
+    async def delete(self, key: str) -> None:
+        try:
+            await self.client.delete(key)
+        except RedisError as e:
+            self.stats.errors += 1
+            logger.warning(f"Cache delete failed for {key}: {e}")
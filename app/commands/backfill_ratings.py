@@ -0,0 +1,79 @@
+"""Recompute product rating aggregates from the reviews table.
+
+python -m app.commands.backfill_ratings
+"""
+
+import asyncio
+
+from sqlalchemy import Integer, cast, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.configs.logger import logger
+from app.db import session
+from app.models import Product, Review
+from app.models.review import RATING_STARS
+
+AGGREGATE_COLUMNS = ["rating_count", "rating_sum"] + [
+    f"rating_star_{star}" for star in RATING_STARS
+]
+
+
+def rating_star_expression():
+    star = cast(func.floor(Review.rating + 0.5), Integer)
+    return func.least(func.greatest(star, RATING_STARS[0]), RATING_STARS[-1])
+
+
+async def backfill_rating_aggregates(db: AsyncSession) -> int:
+    star = rating_star_expression()
+    aggregates = (
+        select(
+            Review.product_id,
+            func.count().label("rating_count"),
+            func.sum(Review.rating).label("rating_sum"),
+            *(
+                func.count().filter(star == value).label(f"rating_star_{value}")
+                for value in RATING_STARS
+            ),
+        )
+        .group_by(Review.product_id)
+        .subquery()
+    )
+    product = aliased(Product)
+    computed = (
+        select(
+            product.id,
+            *(
+                func.coalesce(aggregates.c[name], 0).label(name)
+                for name in AGGREGATE_COLUMNS
+            ),
+        )
+        .outerjoin(aggregates, aggregates.c.product_id == product.id)
+        .subquery()
+    )
+
+    stored = tuple_(*(getattr(Product, name) for name in AGGREGATE_COLUMNS))
+    expected = tuple_(*(computed.c[name] for name in AGGREGATE_COLUMNS))
+    stmt = (
+        update(Product)
+        .where(Product.id == computed.c.id, stored != expected)
+        .values({name: computed.c[name] for name in AGGREGATE_COLUMNS})
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    await db.commit()
+    return result.rowcount
+
+
+async def main() -> None:
+    session.init_engines()
+    try:
+        async with session.AsyncSessionLocal() as db:
+            updated = await backfill_rating_aggregates(db)
+    finally:
+        await session.dispose_engines()
+    logger.info(f"Backfilled rating aggregates for {updated} products")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,6 @@
 import os
 import sys
+from typing import Optional
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -7,6 +8,7 @@ from loguru import logger
 load_dotenv()
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FILE = os.getenv("LOG_FILE", "logs/app.log")
 
 logger.remove()
 
@@ -17,11 +19,31 @@ logger.add(
     serialize=True,
 )
 
-logger.add(
-    "logs/app.log",
-    rotation="10 MB",
-    retention="7 days",
-    level=LOG_LEVEL,
-    serialize=True,
-    enqueue=True,
-)
+_file_sink: Optional[tuple[int, int]] = None
+
+
+def add_file_sink() -> None:
+    """Start the file sink's writer thread in the current process."""
+    global _file_sink
+    if not LOG_FILE or (_file_sink and _file_sink[0] == os.getpid()):
+        return
+
+    sink_id = logger.add(
+        LOG_FILE,
+        rotation="10 MB",
+        retention="7 days",
+        level=LOG_LEVEL,
+        serialize=True,
+        enqueue=True,
+    )
+    _file_sink = (os.getpid(), sink_id)
+
+
+async def remove_file_sink() -> None:
+    global _file_sink
+    if not _file_sink or _file_sink[0] != os.getpid():
+        return
+
+    await logger.complete()
+    logger.remove(_file_sink[1])
+    _file_sink = None
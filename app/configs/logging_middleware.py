@@ -1,25 +1,75 @@
+import os
+import random
 import time
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from dotenv import load_dotenv
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.configs.logger import logger
 
+load_dotenv()
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", 1.0))
+LOG_SLOW_REQUEST_MS = float(os.getenv("LOG_SLOW_REQUEST_MS", 500))
+LOG_EXCLUDE_PATHS = frozenset(
+    path.strip()
+    for path in os.getenv("LOG_EXCLUDE_PATHS", "").split(",")
+    if path.strip()
+)
 
-        response = await call_next(request)
 
-        duration = round((time.time() - start_time) * 1000)
+def route_template(scope: Scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return scope["path"]
+    return scope.get("root_path", "") + path
 
-        logger.bind(
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            duration=duration,
-            client_ip=request.client.host,
-        ).info("Request processed")
 
-        return response
+class LoggingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = LOG_SAMPLE_RATE,
+        slow_request_ms: float = LOG_SLOW_REQUEST_MS,
+        exclude_paths: frozenset[str] = LOG_EXCLUDE_PATHS,
+    ) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_request_ms = slow_request_ms
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = (time.perf_counter_ns() - start) / 1_000_000
+            if self.should_log(scope, status_code, duration):
+                client = scope.get("client")
+                logger.bind(
+                    method=scope["method"],
+                    path=route_template(scope),
+                    status_code=status_code,
+                    duration=round(duration, 3),
+                    client_ip=client[0] if client else None,
+                ).info("Request processed")
+
+    def should_log(self, scope: Scope, status_code: int, duration: float) -> bool:
+        if status_code >= 400 or duration >= self.slow_request_ms:
+            return True
+        if scope["path"] in self.exclude_paths:
+            return False
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
@@ -0,0 +1,67 @@
+import os
+
+from dotenv import load_dotenv
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.configs.logger import logger
+from app.configs.logging_middleware import route_template
+from app.db.query_counter import (
+    QueryBudgetExceeded,
+    QueryStats,
+    count_queries,
+    get_query_budget,
+)
+
+load_dotenv()
+
+DB_QUERY_DEBUG = os.getenv("DB_QUERY_DEBUG", "false").lower() == "true"
+DB_QUERY_BUDGET_STRICT = os.getenv("DB_QUERY_BUDGET_STRICT", "false").lower() == "true"
+DB_N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", 5))
+
+
+class QueryBudgetMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        debug: bool = DB_QUERY_DEBUG,
+        strict: bool = DB_QUERY_BUDGET_STRICT,
+        n_plus_one_threshold: int = DB_N_PLUS_ONE_THRESHOLD,
+    ) -> None:
+        self.app = app
+        self.debug = debug
+        self.strict = strict
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with count_queries() as stats:
+
+            async def send_with_query_count(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    self.check(scope, stats)
+                    if self.debug:
+                        headers = MutableHeaders(scope=message)
+                        headers.append("X-DB-Queries", str(stats.count))
+                await send(message)
+
+            await self.app(scope, receive, send_with_query_count)
+
+    def check(self, scope: Scope, stats: QueryStats) -> None:
+        route = route_template(scope)
+        for statement, count in stats.repeated(self.n_plus_one_threshold):
+            logger.bind(route=route, count=count, statement=statement[:200]).warning(
+                "Possible N+1 query"
+            )
+
+        budget = get_query_budget(scope.get("endpoint"))
+        if budget is None or stats.count <= budget:
+            return
+        message = f"{scope['method']} {route} ran {stats.count} queries"
+        message += f" (budget {budget})"
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+        logger.bind(route=route, queries=stats.count, budget=budget).warning(message)
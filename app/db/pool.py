@@ -0,0 +1,88 @@
+import time
+from dataclasses import asdict, dataclass
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.metrics import DB_POOL_CHECKOUT_WAIT, DB_POOL_CONNECTIONS, DB_POOL_TIMEOUTS
+
+
+@dataclass
+class PoolStats:
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    overflow_peak: int = 0
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout waits and overflow usage."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        self.metrics_label = "default"
+
+    def recreate(self) -> "InstrumentedAsyncPool":
+        pool = super().recreate()
+        pool.stats = self.stats
+        pool.metrics_label = self.metrics_label
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeouts += 1
+            DB_POOL_TIMEOUTS.labels(self.metrics_label).inc()
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.stats.record_wait(waited)
+            DB_POOL_CHECKOUT_WAIT.labels(self.metrics_label).observe(waited)
+
+        self.stats.checkouts += 1
+        self.stats.overflow_peak = max(self.stats.overflow_peak, self.overflow())
+        self.publish_metrics()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        self.stats.checkins += 1
+        super()._do_return_conn(record)
+        self.publish_metrics()
+
+    def publish_metrics(self) -> None:
+        for state, value in (
+            ("size", self.size()),
+            ("checked_in", self.checkedin()),
+            ("checked_out", self.checkedout()),
+            ("overflow", max(self.overflow(), 0)),
+        ):
+            DB_POOL_CONNECTIONS.labels(self.metrics_label, state).set(value)
+
+    def _create_connection(self):
+        self.stats.connects += 1
+        return super()._create_connection()
+
+    def snapshot(self) -> dict:
+        stats = asdict(self.stats)
+        stats["wait_seconds_avg"] = (
+            self.stats.wait_seconds_total / self.stats.checkouts
+            if self.stats.checkouts
+            else 0.0
+        )
+        stats.update(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+        )
+        return stats
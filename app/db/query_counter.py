@@ -0,0 +1,109 @@
+import functools
+import inspect
+from collections import Counter
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+F = TypeVar("F", bound=Callable)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    statements: Counter = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+_active_stats: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "db_query_stats", default=()
+)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    for stats in _active_stats.get():
+        stats.count += 1
+        stats.statements[statement] += 1
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _active_stats.set((*_active_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+class MaxQueries:
+    """Fail when a block or a sync or async function runs too many queries.
+
+    Use as ``with assert_max_queries(2):`` or ``@assert_max_queries(2)``.
+    """
+
+    def __init__(self, max_queries: int) -> None:
+        self.max_queries = max_queries
+        self._scopes: list[tuple[AbstractContextManager, QueryStats]] = []
+
+    def __enter__(self) -> QueryStats:
+        scope = count_queries()
+        stats = scope.__enter__()
+        self._scopes.append((scope, stats))
+        return stats
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        scope, stats = self._scopes.pop()
+        scope.__exit__(exc_type, exc, traceback)
+        if exc_type is None and stats.count > self.max_queries:
+            raise QueryBudgetExceeded(
+                f"Expected at most {self.max_queries} queries, ran {stats.count}"
+            )
+
+    def __call__(self, func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with MaxQueries(self.max_queries):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with MaxQueries(self.max_queries):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+
+def assert_max_queries(max_queries: int) -> MaxQueries:
+    return MaxQueries(max_queries)
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    def decorator(endpoint: F) -> F:
+        endpoint.__query_budget__ = max_queries
+        return endpoint
+
+    return decorator
+
+
+def get_query_budget(endpoint: Optional[Callable]) -> Optional[int]:
+    return getattr(endpoint, "__query_budget__", None)
@@ -1,26 +1,155 @@
 import os
-from typing import AsyncGenerator
+import time
+from typing import AsyncGenerator, Optional
 
 from dotenv import load_dotenv
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.configs.logger import logger
+from app.db.pool import InstrumentedAsyncPool
+from app.metrics import instrument_engine
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=True,
-    future=True,
-)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+DB_REPLICA_CONNECT_TIMEOUT = float(os.getenv("DB_REPLICA_CONNECT_TIMEOUT", 2))
+DB_REPLICA_RETRY_SECONDS = float(os.getenv("DB_REPLICA_RETRY_SECONDS", 30))
+
+
+def engine_options(url: str) -> dict:
+    options = {
+        "echo": DB_ECHO,
+        "poolclass": InstrumentedAsyncPool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    if make_url(url).get_driver_name() == "asyncpg":
+        options["connect_args"] = {"statement_cache_size": DB_STATEMENT_CACHE_SIZE}
+    return options
+
+
+def create_engine(url: str, **overrides) -> AsyncEngine:
+    options = engine_options(url)
+    if "connect_args" in overrides:
+        overrides["connect_args"] = {
+            **options.get("connect_args", {}),
+            **overrides["connect_args"],
+        }
+    return create_async_engine(url, **{**options, **overrides})
+
+
+def get_pool_stats(async_engine: AsyncEngine) -> dict:
+    pool = async_engine.pool
+    if isinstance(pool, InstrumentedAsyncPool):
+        return pool.snapshot()
+    return {"status": pool.status()}
+
+
+engine: Optional[AsyncEngine] = None
+AsyncSessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
+replica_engine: Optional[AsyncEngine] = None
+ReplicaSessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
+
+_engines_pid: Optional[int] = None
+
+_replica_down_until = 0.0
 
-AsyncSessionLocal = async_sessionmaker(
-    bind=engine,
-    expire_on_commit=False,
-    class_=AsyncSession,
-)
+
+def init_engines() -> None:
+    """Create this process's engines; safe to call again, and after a fork."""
+    global engine, AsyncSessionLocal, replica_engine, ReplicaSessionLocal
+    global _engines_pid, _replica_down_until
+    if _engines_pid == os.getpid():
+        return
+
+    for inherited in (engine, replica_engine):
+        if inherited is not None:
+            inherited.sync_engine.dispose(close=False)
+
+    engine = create_engine(DATABASE_URL)
+    instrument_engine(engine, "primary")
+    AsyncSessionLocal = async_sessionmaker(
+        bind=engine,
+        expire_on_commit=False,
+        class_=AsyncSession,
+    )
+
+    replica_engine = None
+    ReplicaSessionLocal = None
+    if DATABASE_REPLICA_URL:
+        replica_engine = create_engine(
+            DATABASE_REPLICA_URL,
+            connect_args={"timeout": DB_REPLICA_CONNECT_TIMEOUT},
+        )
+        instrument_engine(replica_engine, "replica")
+        ReplicaSessionLocal = async_sessionmaker(
+            bind=replica_engine,
+            expire_on_commit=False,
+            class_=AsyncSession,
+        )
+
+    _engines_pid = os.getpid()
+    _replica_down_until = 0.0
+
+
+async def dispose_engines() -> None:
+    global engine, AsyncSessionLocal, replica_engine, ReplicaSessionLocal
+    global _engines_pid
+    if _engines_pid != os.getpid():
+        return
+
+    for async_engine in (engine, replica_engine):
+        if async_engine is not None:
+            await async_engine.dispose()
+    engine = AsyncSessionLocal = replica_engine = ReplicaSessionLocal = None
+    _engines_pid = None
+
+
+async def _open_replica_session() -> Optional[AsyncSession]:
+    global _replica_down_until
+    if ReplicaSessionLocal is None or time.monotonic() < _replica_down_until:
+        return None
+
+    session = ReplicaSessionLocal()
+    try:
+        await session.connection()
+    except (DBAPIError, OSError) as e:
+        await session.close()
+        _replica_down_until = time.monotonic() + DB_REPLICA_RETRY_SECONDS
+        logger.warning(f"Read replica unavailable, falling back to primary: {e}")
+        return None
+    return session
 
 
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    init_engines()
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    init_engines()
+    session = await _open_replica_session()
+    if session is None:
+        session = AsyncSessionLocal()
+    async with session:
+        yield session
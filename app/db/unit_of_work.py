@@ -0,0 +1,37 @@
+from types import TracebackType
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_DEPTH_KEY = "unit_of_work_depth"
+
+
+class UnitOfWork:
+    """Transaction boundary for a service call.
+
+    Repositories only flush. The outermost ``async with UnitOfWork(db)`` on a
+    session commits once if the block succeeds and rolls back if it raises;
+    nested blocks on the same session join the outer transaction.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.db.info[_DEPTH_KEY] = self.db.info.get(_DEPTH_KEY, 0) + 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        depth = self.db.info[_DEPTH_KEY] - 1
+        self.db.info[_DEPTH_KEY] = depth
+        if depth:
+            return
+        if exc_type is None:
+            await self.db.commit()
+        else:
+            await self.db.rollback()
@@ -1,26 +1,43 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from app.configs.logger import add_file_sink
 from app.configs.logging_middleware import LoggingMiddleware
-from app.routes.v1 import (
-    auth, 
-    category, 
-    product, 
-    review, 
-    user,
-    cart
-)
+from app.configs.query_budget_middleware import QueryBudgetMiddleware
+from app.db.session import init_engines
+from app.metrics import MetricsMiddleware
+from app.routes import health, metrics
+from app.routes.v1 import auth, cart, category, product, review, user
+from app.shutdown import shutdown
+from app.warmup import WARMUP_ENABLED, warmup
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    add_file_sink()
+    init_engines()
+    if WARMUP_ENABLED:
+        await warmup(app)
+    yield
+    await shutdown()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
+app.add_middleware(QueryBudgetMiddleware)
 app.add_middleware(LoggingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 routers = [
-    user.router, 
-    auth.router, 
-    category.router, 
-    product.router, 
-    review.router, 
-    cart.router
+    user.router,
+    auth.router,
+    category.router,
+    product.router,
+    review.router,
+    cart.router,
+    metrics.router,
+    health.router,
 ]
 
 for r in routers:
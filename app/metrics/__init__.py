@@ -0,0 +1,29 @@
+from .database import instrument_engine
+from .middleware import MetricsMiddleware
+from .registry import (
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_CONNECTIONS,
+    DB_POOL_TIMEOUTS,
+    DB_QUERY_DURATION,
+    DB_QUERY_ERRORS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+    PASSWORD_HASH_DURATION,
+    mark_process_dead,
+    render_metrics,
+)
+
+__all__ = [
+    "DB_POOL_CHECKOUT_WAIT",
+    "DB_POOL_CONNECTIONS",
+    "DB_POOL_TIMEOUTS",
+    "DB_QUERY_DURATION",
+    "DB_QUERY_ERRORS",
+    "HTTP_REQUEST_DURATION",
+    "HTTP_REQUESTS_IN_PROGRESS",
+    "MetricsMiddleware",
+    "PASSWORD_HASH_DURATION",
+    "instrument_engine",
+    "mark_process_dead",
+    "render_metrics",
+]
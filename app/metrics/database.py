@@ -0,0 +1,42 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .registry import DB_QUERY_DURATION, DB_QUERY_ERRORS
+
+OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+QUERY_START_KEY = "metrics_query_start"
+
+
+def statement_operation(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    return keyword if keyword in OPERATIONS else "OTHER"
+
+
+def instrument_engine(async_engine: AsyncEngine, name: str) -> None:
+    sync_engine = async_engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault(QUERY_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        start = conn.info[QUERY_START_KEY].pop()
+        DB_QUERY_DURATION.labels(name, statement_operation(statement)).observe(
+            time.perf_counter() - start
+        )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        if context.connection is not None:
+            starts = context.connection.info.get(QUERY_START_KEY)
+            if starts:
+                starts.pop()
+        operation = statement_operation(context.statement or "")
+        DB_QUERY_ERRORS.labels(name, operation).inc()
+
+    pool = async_engine.pool
+    if hasattr(pool, "metrics_label"):
+        pool.metrics_label = name
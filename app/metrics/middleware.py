@@ -0,0 +1,44 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .registry import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_label(scope: Scope) -> str:
+    path = getattr(scope.get("route"), "path", None)
+    if path is None:
+        return UNMATCHED_ROUTE
+    return scope.get("root_path", "") + path
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUEST_DURATION.labels(
+                method, route_label(scope), str(status_code)
+            ).observe(time.perf_counter() - start)
+            in_progress.dec()
@@ -0,0 +1,84 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+BCRYPT_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time by engine and statement type.",
+    ["engine", "operation"],
+    buckets=QUERY_BUCKETS,
+)
+DB_QUERY_ERRORS = Counter(
+    "db_query_errors_total",
+    "SQL statements that raised an error.",
+    ["engine", "operation"],
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Connection pool usage by state.",
+    ["engine", "state"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection.",
+    ["engine"],
+    buckets=QUERY_BUCKETS,
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Connection checkouts that timed out.",
+    ["engine"],
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hashing and verification time.",
+    ["operation"],
+    buckets=BCRYPT_BUCKETS,
+)
+
+
+def is_multiprocess() -> bool:
+    return bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    registry = REGISTRY
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid)
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import re
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, relationship, validates
 
@@ -18,9 +18,10 @@ if TYPE_CHECKING:
 @mapper_registry.mapped
 class Address:
     __tablename__ = "addresses"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = Column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
     )
     user_id: Mapped[uuid.UUID] = Column(
         UUID(as_uuid=True), ForeignKey("users.id"), nullable=False
@@ -33,10 +34,10 @@ class Address:
     is_default_shipping: Mapped[bool] = Column(Boolean, default=False)
     is_default_billing: Mapped[bool] = Column(Boolean, default=False)
     created_at: Mapped[datetime] = Column(
-        DateTime(timezone=True), default=datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = Column(
-        DateTime(timezone=True), default=datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     user: Mapped["User"] = relationship("User", back_populates="addresses")
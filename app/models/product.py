@@ -1,19 +1,23 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     DateTime,
     Double,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.db import mapper_registry
@@ -24,14 +28,40 @@ if TYPE_CHECKING:
 
 MIN_NAME_LENGTH = 2
 MAX_NAME_LENGTH = 255
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(name, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')"
+)
 
 
 @mapper_registry.mapped
 class Product:
     __tablename__ = "products"
+    __table_args__ = (
+        Index("ix_products_created_at_id", "created_at", "id"),
+        Index(
+            "ix_products_category_id_created_at_id", "category_id", "created_at", "id"
+        ),
+        Index(
+            "ix_products_active_category_id_price",
+            "category_id",
+            "price",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_products_active_price_id",
+            "price",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+        Index("ix_products_search_vector", "search_vector", postgresql_using="gin"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
@@ -39,10 +69,36 @@ class Product:
     price: Mapped[float] = mapped_column(Double, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    rating_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_sum: Mapped[float] = mapped_column(
+        Double, nullable=False, default=0.0, server_default="0"
+    )
+    rating_star_1: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_star_2: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_star_3: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_star_4: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    rating_star_5: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True), deferred=True
     )
 
     category_id: Mapped[uuid.UUID] = mapped_column(
@@ -53,6 +109,22 @@ class Product:
         "Review", back_populates="product", cascade="all, delete-orphan"
     )
 
+    @property
+    def rating_histogram(self) -> list[int]:
+        return [
+            self.rating_star_1 or 0,
+            self.rating_star_2 or 0,
+            self.rating_star_3 or 0,
+            self.rating_star_4 or 0,
+            self.rating_star_5 or 0,
+        ]
+
+    @property
+    def rating_average(self) -> Optional[float]:
+        if not self.rating_count:
+            return None
+        return round(self.rating_sum / self.rating_count, 2)
+
     @validates("name")
     def validate_name(self, key: str, name: str) -> str:
         if len(name) < MIN_NAME_LENGTH or len(name) > MAX_NAME_LENGTH:
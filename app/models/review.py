@@ -1,8 +1,8 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
@@ -15,14 +15,23 @@ if TYPE_CHECKING:
 MIN_RATING = 1.0
 MAX_RATING = 5.0
 MAX_COMMENT_LENGTH = 1000
+RATING_STARS = (1, 2, 3, 4, 5)
+
+
+def rating_star(rating: float) -> int:
+    return min(max(int(rating + 0.5), RATING_STARS[0]), RATING_STARS[-1])
 
 
 @mapper_registry.mapped
 class Review:
     __tablename__ = "reviews"
+    __table_args__ = (
+        Index("ix_reviews_product_id_created_at", "product_id", "created_at"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, server_default=func.gen_random_uuid()
     )
 
     product_id: Mapped[uuid.UUID] = mapped_column(
@@ -34,12 +43,10 @@ class Review:
     rating: Mapped[float] = mapped_column(Float, nullable=False)
     comment: Mapped[str] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+        DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
     product: Mapped["Product"] = relationship(back_populates="reviews")
@@ -1,8 +1,55 @@
+import asyncio
+import os
 import re
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 import bcrypt
+from dotenv import load_dotenv
 from pydantic import BaseModel, field_validator
 
+from app.metrics import PASSWORD_HASH_DURATION
+
+load_dotenv()
+
+BCRYPT_MAX_WORKERS = int(os.getenv("BCRYPT_MAX_WORKERS", 4))
+BCRYPT_MAX_CONCURRENCY = int(os.getenv("BCRYPT_MAX_CONCURRENCY", BCRYPT_MAX_WORKERS))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=BCRYPT_MAX_WORKERS, thread_name_prefix="bcrypt"
+        )
+    return _executor
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(BCRYPT_MAX_CONCURRENCY)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _run_bcrypt(func, *args):
+    async with _get_semaphore():
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), func, *args)
+
+
+def shutdown_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
 
 class Password(BaseModel):
     raw: str
@@ -20,9 +67,17 @@ class Password(BaseModel):
         return v
 
     def hash(self) -> str:
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(self.raw.encode(), salt)
+        with PASSWORD_HASH_DURATION.labels("hash").time():
+            salt = bcrypt.gensalt()
+            hashed = bcrypt.hashpw(self.raw.encode(), salt)
         return hashed.decode()
 
     def verify(self, hashed_password: str) -> bool:
-        return bcrypt.checkpw(self.raw.encode(), hashed_password.encode())
+        with PASSWORD_HASH_DURATION.labels("verify").time():
+            return bcrypt.checkpw(self.raw.encode(), hashed_password.encode())
+
+    async def hash_async(self) -> str:
+        return await _run_bcrypt(self.hash)
+
+    async def verify_async(self, hashed_password: str) -> bool:
+        return await _run_bcrypt(self.verify, hashed_password)
@@ -28,10 +28,8 @@ class AddressRepository:
         )
         self.db.add(db_address)
         try:
-            await self.db.commit()
-            await self.db.refresh(db_address)
+            await self.db.flush()
         except IntegrityError as e:
-            await self.db.rollback()
             raise ValueError("Address already exists") from e
         return db_address
 
@@ -42,13 +40,12 @@ class AddressRepository:
     async def update(self, address: Address, updates: AddressUpdate) -> Address:
         for field, value in updates.model_dump(exclude_unset=True).items():
             setattr(address, field, value)
-        await self.db.commit()
-        await self.db.refresh(address)
+        await self.db.flush()
         return address
 
     async def delete(self, address: Address) -> None:
         await self.db.delete(address)
-        await self.db.commit()
+        await self.db.flush()
 
     async def list(
         self, user_id: UUID, skip: int = 0, limit: int = 100
@@ -1,11 +1,13 @@
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import exists, func, update
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
-from app.models import Cart
+from app.models import Address, Cart, CartItem, Category, Product
 from app.schema.cart import CartCreate, CartRead
 
 class CartRepository:
@@ -17,25 +19,100 @@ class CartRepository:
             user_id=cart_data.user_id,
             is_active=True,
             is_checked_out=False,
+            items=[],
         )
         self.db.add(db_cart)
-        await self.db.commit()
-        await self.db.refresh(db_cart)
+        await self.db.flush()
         return db_cart
     
+    async def has_active_cart(self, user_id: UUID) -> bool:
+        stmt = select(
+            exists().where(Cart.user_id == user_id, Cart.is_active.is_(True))
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar()
+
     async def get_cart_by_user_id(self, user_id: UUID) -> Optional[Cart]:
         stmt = (
             select(Cart)
-            .options(selectinload(Cart.items))
+            .options(
+                joinedload(Cart.items)
+                .joinedload(CartItem.product)
+                .joinedload(Product.category)
+            )
             .filter(
                 Cart.user_id == user_id, 
                 Cart.is_active.is_(True), 
                 Cart.is_checked_out.is_(False)
-            ))
+            )
+            .order_by(Cart.created_at, Cart.id))
         
         result = await self.db.execute(stmt)
-        return result.scalars().first()
+        return result.unique().scalars().first()
+
+    async def get_version_by_user_id(self, user_id: UUID) -> Optional[Row]:
+        stmt = (
+            select(
+                Cart.id,
+                func.greatest(
+                    Cart.updated_at,
+                    func.max(CartItem.updated_at),
+                    func.max(Product.updated_at),
+                    func.max(Category.updated_at),
+                ).label("updated_at"),
+                func.count(CartItem.id).label("item_count"),
+            )
+            .outerjoin(Cart.items)
+            .outerjoin(CartItem.product)
+            .outerjoin(Product.category)
+            .where(
+                Cart.user_id == user_id,
+                Cart.is_active.is_(True),
+                Cart.is_checked_out.is_(False),
+            )
+            .group_by(Cart.id)
+            .order_by(Cart.created_at, Cart.id)
+            .limit(1)
+        )
+        result = await self.db.execute(stmt)
+        return result.first()
     
+    async def get_cart_with_items(self, cart_id: UUID) -> Optional[Cart]:
+        stmt = (
+            select(Cart)
+            .where(Cart.id == cart_id)
+            .options(
+                joinedload(Cart.items)
+                .joinedload(CartItem.product)
+                .joinedload(Product.category)
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.unique().scalar_one_or_none()
+
+    async def claim_for_checkout(
+        self, cart_id: UUID, shipping_address_id: UUID, billing_address_id: UUID
+    ) -> Optional[Row]:
+        def owned_by_cart_user(address_id: UUID):
+            return exists().where(
+                Address.id == address_id, Address.user_id == Cart.user_id
+            )
+
+        stmt = (
+            update(Cart)
+            .where(Cart.id == cart_id, Cart.is_checked_out.is_(False))
+            .values(is_checked_out=True, is_active=False, updated_at=func.now())
+            .returning(
+                Cart.user_id,
+                exists().where(CartItem.cart_id == Cart.id).label("has_items"),
+                owned_by_cart_user(shipping_address_id).label("shipping_ok"),
+                owned_by_cart_user(billing_address_id).label("billing_ok"),
+            )
+        )
+        result = await self.db.execute(stmt)
+        return result.one_or_none()
+
     async def list_carts(self) -> List[Cart]:
         stmt = select(Cart).options(selectinload(Cart.items))
         result = await self.db.execute(stmt)
@@ -43,4 +120,4 @@ class CartRepository:
 
     async def delete_cart(self, cart: Cart) -> None:
         await self.db.delete(cart)
-        await self.db.commit()
\ No newline at end of file
+        await self.db.flush()
\ No newline at end of file
@@ -1,12 +1,15 @@
+import uuid
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
+from sqlalchemy import Integer, Uuid, column, delete, func, literal, values
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, contains_eager, selectinload
 
-from app.models import CartItem, Product
+from app.models import Cart, CartItem, Product
 from app.schema.cart_item import CartItemCreate, CartItemRead
 
 class CartItemRepository:
@@ -29,7 +32,104 @@ class CartItemRepository:
         )
 
         self.db.add(db_cart_item)
-        await self.db.commit()
-        await self.db.refresh(db_cart_item)
+        await self.db.flush()
 
-        return db_cart_item
\ No newline at end of file
+        return db_cart_item
+
+    async def upsert_cart_item(
+        self, cart_item_data: CartItemCreate
+    ) -> Optional[tuple[CartItem, UUID]]:
+        now = func.now()
+        values = select(
+            literal(uuid.uuid4()),
+            Cart.id,
+            literal(cart_item_data.product_id),
+            literal(cart_item_data.quantity),
+            literal(cart_item_data.price_snapshot),
+            now,
+            now,
+        ).where(Cart.id == cart_item_data.cart_id)
+        stmt = insert(CartItem).from_select(
+            [
+                CartItem.id,
+                CartItem.cart_id,
+                CartItem.product_id,
+                CartItem.quantity,
+                CartItem.price_snapshot,
+                CartItem.created_at,
+                CartItem.updated_at,
+            ],
+            values,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_cart_items_cart_id_product_id",
+            set_={
+                "quantity": CartItem.quantity + stmt.excluded.quantity,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(*CartItem.__table__.columns)
+        upserted = stmt.cte("upserted")
+        item = aliased(CartItem, upserted)
+
+        result = await self.db.execute(
+            select(item, Cart.user_id)
+            .join(Cart, Cart.id == item.cart_id)
+            .join(item.product)
+            .join(Product.category)
+            .options(contains_eager(item.product).contains_eager(Product.category))
+            .execution_options(populate_existing=True)
+        )
+        return result.one_or_none()
+
+    async def upsert_cart_items(
+        self, cart_id: UUID, quantities: dict[UUID, int], increment: bool
+    ) -> set[UUID]:
+        requested = values(
+            column("product_id", Uuid),
+            column("quantity", Integer),
+            name="requested",
+        ).data(list(quantities.items()))
+        now = func.now()
+        rows = (
+            select(
+                func.gen_random_uuid(),
+                Cart.id,
+                Product.id,
+                requested.c.quantity,
+                Product.price,
+                now,
+                now,
+            )
+            .select_from(requested)
+            .join(Product, Product.id == requested.c.product_id)
+            .join(Cart, Cart.id == cart_id)
+        )
+        stmt = insert(CartItem).from_select(
+            [
+                CartItem.id,
+                CartItem.cart_id,
+                CartItem.product_id,
+                CartItem.quantity,
+                CartItem.price_snapshot,
+                CartItem.created_at,
+                CartItem.updated_at,
+            ],
+            rows,
+        )
+        quantity = stmt.excluded.quantity
+        if increment:
+            quantity = CartItem.quantity + quantity
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_cart_items_cart_id_product_id",
+            set_={"quantity": quantity, "updated_at": stmt.excluded.updated_at},
+        ).returning(CartItem.product_id)
+
+        result = await self.db.execute(stmt)
+        return set(result.scalars().all())
+
+    async def delete_cart_items(self, cart_id: UUID, product_ids: set[UUID]) -> None:
+        await self.db.execute(
+            delete(CartItem).where(
+                CartItem.cart_id == cart_id, CartItem.product_id.in_(product_ids)
+            )
+        )
@@ -1,7 +1,8 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -21,19 +22,28 @@ class CategoryRepository:
         )
         self.db.add(db_category)
         try:
-            await self.db.commit()
-            await self.db.refresh(db_category)
+            await self.db.flush()
         except IntegrityError as e:
-            await self.db.rollback()
             raise ValueError("Category name must be unique") from e
 
         return db_category
 
     async def list_categories(self) -> List[Category]:
-        stmt = select(Category).options(selectinload(Category.products))
+        stmt = select(Category)
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_list_version(self) -> Row:
+        stmt = select(
+            func.count(Category.id).label("count"),
+            func.max(Category.updated_at).label("updated_at"),
+        )
+        result = await self.db.execute(stmt)
+        return result.one()
+
+    async def get(self, category_id: UUID) -> Optional[Category]:
+        return await self.db.get(Category, category_id)
+
     async def get_by_id(self, category_id: UUID) -> Optional[Category]:
         stmt = (
             select(Category)
@@ -51,10 +61,9 @@ class CategoryRepository:
     async def update(self, category: Category, updates: CategoryUpdate) -> Category:
         for field, value in updates.model_dump(exclude_unset=True).items():
             setattr(category, field, value)
-        await self.db.commit()
-        await self.db.refresh(category)
+        await self.db.flush()
         return category
 
     async def delete(self, category: Category) -> None:
         await self.db.delete(category)
-        await self.db.commit()
+        await self.db.flush()
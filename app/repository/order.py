@@ -0,0 +1,117 @@
+import uuid
+from uuid import UUID
+
+from sqlalchemy import func, insert, literal, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CartItem, Order, OrderItem, OrderStatus, Product
+
+
+class OrderRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_from_cart(
+        self,
+        cart_id: UUID,
+        user_id: UUID,
+        shipping_address_id: UUID,
+        billing_address_id: UUID,
+    ) -> list[Row]:
+        order_id = uuid.uuid4()
+        now = func.now()
+
+        lines = (
+            select(CartItem.product_id, CartItem.quantity, Product.price)
+            .join(Product, Product.id == CartItem.product_id)
+            .where(CartItem.cart_id == cart_id)
+            .cte("lines")
+        )
+        # Lock every product row in id order before decrementing, so concurrent
+        # checkouts over overlapping products queue instead of deadlocking. NO KEY
+        # UPDATE leaves foreign key checks from cart and order items unblocked.
+        locked = (
+            select(Product.id)
+            .where(Product.id.in_(select(lines.c.product_id)))
+            .order_by(Product.id)
+            .with_for_update(key_share=True)
+            .cte("locked")
+            .prefix_with("MATERIALIZED", dialect="postgresql")
+        )
+        reserved = (
+            update(Product)
+            .where(
+                Product.id == locked.c.id,
+                Product.id == lines.c.product_id,
+                Product.is_active.is_(True),
+                Product.stock >= lines.c.quantity,
+            )
+            .values(stock=Product.stock - lines.c.quantity, updated_at=now)
+            .returning(Product.id)
+            .cte("reserved")
+        )
+        new_order = (
+            insert(Order)
+            .from_select(
+                [
+                    Order.id,
+                    Order.user_id,
+                    Order.status,
+                    Order.total_price,
+                    Order.shipping_address_id,
+                    Order.billing_address_id,
+                    Order.created_at,
+                    Order.updated_at,
+                ],
+                select(
+                    literal(order_id),
+                    literal(user_id),
+                    literal(OrderStatus.PENDING, Order.__table__.c.order_status.type),
+                    select(
+                        func.coalesce(func.sum(lines.c.quantity * lines.c.price), 0)
+                    ).scalar_subquery(),
+                    literal(shipping_address_id),
+                    literal(billing_address_id),
+                    now,
+                    now,
+                ),
+            )
+            .returning(Order.id, Order.total_price, Order.created_at)
+            .cte("new_order")
+        )
+        items = (
+            insert(OrderItem)
+            .from_select(
+                [
+                    OrderItem.id,
+                    OrderItem.order_id,
+                    OrderItem.product_id,
+                    OrderItem.quantity,
+                    OrderItem.price_snapshot,
+                ],
+                select(
+                    func.gen_random_uuid(),
+                    literal(order_id),
+                    lines.c.product_id,
+                    lines.c.quantity,
+                    lines.c.price,
+                ),
+            )
+            .returning(
+                OrderItem.product_id, OrderItem.quantity, OrderItem.price_snapshot
+            )
+            .cte("items")
+        )
+
+        stmt = select(
+            new_order.c.id.label("order_id"),
+            new_order.c.total_price,
+            new_order.c.created_at,
+            items.c.product_id,
+            items.c.quantity,
+            items.c.price_snapshot,
+            select(func.array_agg(reserved.c.id)).scalar_subquery().label("reserved"),
+        ).select_from(new_order.join(items, literal(True)))
+        result = await self.db.execute(stmt)
+        return result.all()
@@ -1,12 +1,66 @@
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Double,
+    Row,
+    and_,
+    cast,
+    func,
+    select,
+    text,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, array
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
-from app.models import Product
-from app.schema.product import ProductCreate, ProductUpdate
+from app.models import Category, Product
+from app.models.product import SEARCH_CONFIG
+from app.schema.product import (
+    ProductCreate,
+    ProductFilter,
+    ProductSort,
+    ProductUpdate,
+    SortOrder,
+)
+
+IMPORT_STAGING_TABLE = "products_import"
+IMPORT_COLUMNS = (
+    "name",
+    "description",
+    "stock",
+    "price",
+    "is_active",
+    "category_id",
+)
+
+
+def _state_conditions(filters: ProductFilter) -> list[ColumnElement[bool]]:
+    conditions = []
+    if filters.is_active is not None:
+        conditions.append(Product.is_active == filters.is_active)
+    if filters.in_stock is not None:
+        conditions.append((Product.stock > 0) == filters.in_stock)
+    return conditions
+
+
+def _category_conditions(filters: ProductFilter) -> list[ColumnElement[bool]]:
+    if filters.category_id is None:
+        return []
+    return [Product.category_id == filters.category_id]
+
+
+def _price_conditions(filters: ProductFilter) -> list[ColumnElement[bool]]:
+    conditions = []
+    if filters.min_price is not None:
+        conditions.append(Product.price >= filters.min_price)
+    if filters.max_price is not None:
+        conditions.append(Product.price <= filters.max_price)
+    return conditions
 
 
 class ProductRepository:
@@ -37,23 +91,167 @@ class ProductRepository:
         result = await self.db.execute(stmt)
         return result.scalars().first()
 
+    async def get_version(self, product_id: UUID) -> Optional[Row]:
+        stmt = (
+            select(Product.updated_at, Category.updated_at.label("category_updated_at"))
+            .join(Product.category)
+            .where(Product.id == product_id)
+        )
+        result = await self.db.execute(stmt)
+        return result.one_or_none()
+
     async def get_by_name(self, name: str) -> Optional[Product]:
         stmt = select(Product).filter(Product.name == name)
         result = await self.db.execute(stmt)
         return result.scalars().first()
 
     async def update(self, product: Product, updates: ProductUpdate) -> Product:
-        for field, value in updates.model_dump(exclude_unset=True).items():
+        values = updates.model_dump(exclude_unset=True)
+        for field, value in values.items():
             setattr(product, field, value)
-        await self.db.commit()
-        await self.db.refresh(product)
+        await self.db.flush()
+        if "category_id" in values:
+            await self.db.refresh(product, ["category"])
         return product
 
     async def delete(self, product: Product) -> None:
         await self.db.delete(product)
-        await self.db.commit()
+        await self.db.flush()
+
+    async def list_products(
+        self,
+        limit: int,
+        after: Optional[tuple[Any, UUID]] = None,
+        filters: Optional[ProductFilter] = None,
+        sort: ProductSort = ProductSort.CREATED_AT,
+        order: SortOrder = SortOrder.ASC,
+    ) -> list[Product]:
+        filters = filters or ProductFilter()
+        sort_column = getattr(Product, sort.value)
+        keyset = tuple_(sort_column, Product.id)
+        if order == SortOrder.DESC:
+            ordering = (sort_column.desc(), Product.id.desc())
+        else:
+            ordering = (sort_column, Product.id)
 
-    async def list_products(self) -> list[Product]:
-        stmt = select(Product).options(selectinload(Product.category))
+        stmt = (
+            select(Product)
+            .options(selectinload(Product.category))
+            .where(
+                *_state_conditions(filters),
+                *_category_conditions(filters),
+                *_price_conditions(filters),
+            )
+            .order_by(*ordering)
+            .limit(limit)
+        )
+        if after is not None:
+            if order == SortOrder.DESC:
+                stmt = stmt.where(keyset < after)
+            else:
+                stmt = stmt.where(keyset > after)
         result = await self.db.execute(stmt)
         return result.scalars().all()
+
+    async def facet_counts(
+        self, filters: ProductFilter, price_boundaries: list[float]
+    ) -> list[Row]:
+        category_match = and_(true(), *_category_conditions(filters))
+        price_match = and_(true(), *_price_conditions(filters))
+        bucket = func.width_bucket(
+            Product.price, cast(array(price_boundaries), ARRAY(Double))
+        )
+        stmt = (
+            select(
+                Category.id.label("category_id"),
+                Category.name,
+                bucket.label("bucket"),
+                func.grouping(Category.id).label("is_price_facet"),
+                func.count().filter(price_match).label("category_count"),
+                func.count().filter(category_match).label("price_count"),
+            )
+            .select_from(Product)
+            .join(Product.category)
+            .where(*_state_conditions(filters))
+            .group_by(
+                func.grouping_sets(tuple_(Category.id, Category.name), tuple_(bucket))
+            )
+        )
+        result = await self.db.execute(stmt)
+        return result.all()
+
+    async def search_products(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+        category_id: Optional[UUID] = None,
+    ) -> list[Product]:
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank(Product.search_vector, tsquery)
+        stmt = (
+            select(Product)
+            .options(joinedload(Product.category, innerjoin=True))
+            .where(Product.search_vector.bool_op("@@")(tsquery))
+            .order_by(rank.desc(), Product.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        if category_id:
+            stmt = stmt.where(Product.category_id == category_id)
+
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def existing_category_ids(self, category_ids: set[UUID]) -> set[UUID]:
+        stmt = select(Category.id).where(Category.id.in_(category_ids))
+        result = await self.db.execute(stmt)
+        return set(result.scalars().all())
+
+    async def create_import_staging_table(self) -> None:
+        columns = ", ".join(IMPORT_COLUMNS)
+        await self.db.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {IMPORT_STAGING_TABLE} "
+                f"ON COMMIT DROP AS SELECT {columns} FROM products WITH NO DATA"
+            )
+        )
+
+    async def copy_to_import_staging(self, records: list[tuple]) -> None:
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            IMPORT_STAGING_TABLE, records=records, columns=IMPORT_COLUMNS
+        )
+
+    async def insert_from_import_staging(self) -> int:
+        columns = ", ".join(IMPORT_COLUMNS)
+        result = await self.db.execute(
+            text(
+                f"INSERT INTO products (id, {columns}, created_at, updated_at) "
+                f"SELECT gen_random_uuid(), {columns}, now(), now() "
+                f"FROM {IMPORT_STAGING_TABLE}"
+            )
+        )
+        return result.rowcount
+
+    async def apply_rating_change(
+        self,
+        product_id: UUID,
+        count_delta: int,
+        sum_delta: float,
+        star_deltas: dict[int, int],
+    ) -> int:
+        values = {
+            "rating_count": Product.rating_count + count_delta,
+            "rating_sum": Product.rating_sum + sum_delta,
+        }
+        for star, delta in star_deltas.items():
+            if delta:
+                column = getattr(Product, f"rating_star_{star}")
+                values[column.key] = column + delta
+
+        result = await self.db.execute(
+            update(Product).where(Product.id == product_id).values(**values)
+        )
+        return result.rowcount
@@ -1,12 +1,24 @@
-from typing import List, Optional
+from typing import Any, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models import Review
-from app.schema.review import ReviewCreate
+from app.schema.review import ReviewCreate, ReviewSort
+
+REVIEW_READ_COLUMNS = (
+    Review.id,
+    Review.product_id,
+    Review.user_id,
+    Review.rating,
+    Review.comment,
+    Review.created_at,
+    Review.updated_at,
+)
 
 
 class ReviewRepository:
@@ -21,8 +33,12 @@ class ReviewRepository:
             comment=review_data.comment,
         )
         self.db.add(db_review)
-        await self.db.commit()
-        await self.db.refresh(db_review)
+        try:
+            await self.db.flush()
+        except IntegrityError as e:
+            raise ValueError(
+                f"User with id {review_data.user_id} does not exist"
+            ) from e
         return db_review
 
     async def get_reviews_by_product_id(self, product_id: UUID) -> List[Review]:
@@ -34,8 +50,12 @@ class ReviewRepository:
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
-    async def get_review_by_id(self, review_id: UUID) -> Optional[Review]:
+    async def get_review_by_id(
+        self, review_id: UUID, for_update: bool = False
+    ) -> Optional[Review]:
         stmt = select(Review).filter(Review.id == review_id)
+        if for_update:
+            stmt = stmt.with_for_update().execution_options(populate_existing=True)
         result = await self.db.execute(stmt)
         return result.scalars().first()
 
@@ -43,3 +63,24 @@ class ReviewRepository:
         stmt = select(Review).options(selectinload(Review.user))
         result = await self.db.execute(stmt)
         return result.scalars().all()
+
+    async def list_review_rows(
+        self,
+        limit: int,
+        sort: ReviewSort,
+        product_id: Optional[UUID] = None,
+        before: Optional[tuple[Any, UUID]] = None,
+    ) -> List[Row]:
+        sort_column = getattr(Review, sort.value)
+        stmt = (
+            select(*REVIEW_READ_COLUMNS)
+            .order_by(sort_column.desc(), Review.id.desc())
+            .limit(limit)
+        )
+        if product_id:
+            stmt = stmt.where(Review.product_id == product_id)
+        if before:
+            stmt = stmt.where(tuple_(sort_column, Review.id) < before)
+
+        result = await self.db.execute(stmt)
+        return result.all()
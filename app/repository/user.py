@@ -6,7 +6,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models import User
+from app.models import Address, User
 from app.models.value_objects import Password
 from app.schema.user import UserCreate, UserUpdate
 
@@ -19,16 +19,18 @@ class UserRepository:
         db_user = User(
             email=user_data.email,
             full_name=user_data.full_name,
-            hashed_password=user_data.password.hash(),
+            hashed_password=await user_data.password.hash_async(),
             is_active=user_data.is_active,
             is_superuser=user_data.is_superuser,
+            addresses=[
+                Address(**address_data.model_dump())
+                for address_data in user_data.addresses
+            ],
         )
         self.db.add(db_user)
         try:
-            await self.db.commit()
-            await self.db.refresh(db_user)
+            await self.db.flush()
         except IntegrityError as e:
-            await self.db.rollback()
             raise ValueError("Email already exists") from e
         return db_user
 
@@ -53,16 +55,15 @@ class UserRepository:
                     value = Password(**value)
                 elif isinstance(value, str):
                     value = Password(raw=value)
-                setattr(user, "hashed_password", value.hash())
+                setattr(user, "hashed_password", await value.hash_async())
             else:
                 setattr(user, field, value)
-        await self.db.commit()
-        await self.db.refresh(user)
+        await self.db.flush()
         return user
 
     async def delete(self, user: User) -> None:
         await self.db.delete(user)
-        await self.db.commit()
+        await self.db.flush()
 
     async def list(self, skip: int = 0, limit: int = 100) -> list[User]:
         stmt = select(User).offset(skip).limit(limit)
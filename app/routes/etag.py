@@ -0,0 +1,30 @@
+import hashlib
+from datetime import datetime
+from typing import Any
+
+from fastapi import Request, Response
+
+
+def _normalize(part: Any) -> str:
+    if isinstance(part, datetime):
+        return part.isoformat()
+    return str(part)
+
+
+def make_etag(*parts: Any) -> str:
+    payload = "\x1f".join(_normalize(part) for part in parts).encode()
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    if "*" in candidates:
+        return True
+    return etag in candidates or f"W/{etag}" in candidates
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
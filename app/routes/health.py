@@ -0,0 +1,18 @@
+from fastapi import APIRouter
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("", include_in_schema=False)
+async def liveness():
+    return {"status": "ok"}
+
+
+@router.get("/ready", include_in_schema=False)
+async def readiness():
+    """Readiness probe for load balancers and orchestrators.
+
+    uvicorn serves nothing until lifespan startup, including warmup, has
+    finished, so any answer here means the worker is ready.
+    """
+    return {"status": "ready"}
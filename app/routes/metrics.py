@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Response
+
+from app.metrics import render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    content, media_type = render_metrics()
+    return Response(content, media_type=media_type)
@@ -0,0 +1,20 @@
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+
+from app.schema.adapters import type_adapter
+
+
+def json_response(
+    content: Any,
+    tp: Any = None,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    adapter = type_adapter(tp if tp is not None else type(content))
+    return Response(
+        adapter.dump_json(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -17,7 +17,9 @@ async def login(
 ):
     repo = UserRepository(db)
     user = await repo.get_by_email(form_data.username)
-    if not user or not Password(raw=form_data.password).verify(user.hashed_password):
+    if not user or not await Password(raw=form_data.password).verify_async(
+        user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -1,14 +1,18 @@
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.query_counter import query_budget
 from app.db.session import get_async_db
+from app.routes.etag import etag_matches, make_etag, not_modified
 from app.schema.cart import CartCreate, CartRead, CartUpdate
-from app.schema.cart_item import CartItemCreate
+from app.schema.cart_item import CartItemBatch, CartItemCreate
+from app.schema.checkout import CheckoutCreate, CheckoutRead
 from app.services.cart import CartService
 from app.services.cart_item import CartItemService
+from app.services.checkout import CheckoutService
 
 router = APIRouter(prefix="/cart", tags=["cart"])
 
@@ -25,13 +29,22 @@ async def create_cart(
         raise HTTPException(status_code=e.status_code, detail=e.detail)
     
 @router.get("/{user_id}", response_model=CartRead)
+@query_budget(2)
 async def get_cart_by_user_id(
     user_id: UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_async_db),
 ):
     try:
         cart_service = CartService(db)
+        version = await cart_service.get_cart_version(user_id)
+        etag = make_etag("cart", *version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
         cart = await cart_service.get_cart_by_user_id(user_id)
+        response.headers["ETag"] = etag
         return cart
     except HTTPException as e:
         raise HTTPException(status_code=e.status_code, detail=e.detail)
@@ -69,4 +82,30 @@ async def add_item_to_cart(
         cart = await cart_item_service.create_cart_item(cart_item_data)
         return cart
     except HTTPException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.detail)
\ No newline at end of file
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+@router.post("/{cart_id}/items/batch", response_model=CartRead)
+async def apply_cart_item_batch(
+    cart_id: UUID,
+    batch: CartItemBatch,
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        cart_item_service = CartItemService(db)
+        cart = await cart_item_service.apply_batch(cart_id, batch)
+        return cart
+    except HTTPException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+@router.post("/{cart_id}/checkout", response_model=CheckoutRead)
+async def checkout_cart(
+    cart_id: UUID,
+    checkout_data: CheckoutCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        checkout_service = CheckoutService(db)
+        order = await checkout_service.checkout(cart_id, checkout_data)
+        return order
+    except HTTPException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
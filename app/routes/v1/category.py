@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_async_db
+from app.db.query_counter import query_budget
+from app.db.session import get_async_db, get_async_read_db
+from app.routes.etag import etag_matches, make_etag, not_modified
+from app.routes.responses import json_response
 from app.schema.category import CategoryCreate, CategoryRead, CategoryUpdate
 from app.services.category import CategoryService
 
@@ -22,10 +25,19 @@ async def create_category(
 
 
 @router.get("/", response_model=list[CategoryRead])
-async def list_categories(db: AsyncSession = Depends(get_async_db)):
+@query_budget(2)
+async def list_categories(
+    request: Request,
+    db: AsyncSession = Depends(get_async_read_db),
+):
     category_service = CategoryService(db)
+    version = await category_service.get_categories_version()
+    etag = make_etag("categories", *version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     categories = await category_service.list_categories()
-    return categories
+    return json_response(categories, list[CategoryRead], headers={"ETag": etag})
 
 
 @router.get("/{category_id}", response_model=CategoryRead)
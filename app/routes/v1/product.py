@@ -1,15 +1,53 @@
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_async_db
-from app.schema.product import ProductCreate, ProductRead, ProductUpdate
+from app.db.query_counter import query_budget
+from app.db.session import get_async_db, get_async_read_db
+from app.routes.etag import etag_matches, make_etag, not_modified
+from app.routes.responses import json_response
+from app.schema.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from app.schema.product import (
+    ProductCreate,
+    ProductFacets,
+    ProductFilter,
+    ProductImportResult,
+    ProductRead,
+    ProductSort,
+    ProductUpdate,
+    SortOrder,
+)
 from app.services.product import ProductService
+from app.services.product_import import ProductImportService
 
 router = APIRouter(prefix="/product", tags=["product"])
 
 
+def get_product_filter(
+    category_id: Optional[UUID] = None,
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    is_active: Optional[bool] = None,
+    in_stock: Optional[bool] = None,
+) -> ProductFilter:
+    try:
+        return ProductFilter(
+            category_id=category_id,
+            min_price=min_price,
+            max_price=max_price,
+            is_active=is_active,
+            in_stock=in_stock,
+        )
+    except ValidationError as e:
+        raise RequestValidationError(
+            e.errors(include_url=False, include_context=False)
+        ) from e
+
+
 @router.post("/", response_model=ProductRead)
 async def create_product(
     product_data: ProductCreate,
@@ -23,21 +61,86 @@ async def create_product(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/", response_model=list[ProductRead])
-async def list_products(db: AsyncSession = Depends(get_async_db)):
+@router.get("/", response_model=Page[ProductRead])
+@query_budget(2)
+async def list_products(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    sort: ProductSort = ProductSort.CREATED_AT,
+    order: SortOrder = SortOrder.ASC,
+    filters: ProductFilter = Depends(get_product_filter),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    try:
+        product_service = ProductService(db)
+        products = await product_service.list_products(
+            limit, cursor, filters, sort, order
+        )
+        return json_response(products)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/facets", response_model=ProductFacets)
+@query_budget(1)
+async def get_product_facets(
+    filters: ProductFilter = Depends(get_product_filter),
+    db: AsyncSession = Depends(get_async_read_db),
+):
     product_service = ProductService(db)
-    products = await product_service.list_products()
-    return products
+    facets = await product_service.get_facets(filters)
+    return facets
+
+
+@router.get("/search", response_model=Page[ProductRead])
+@query_budget(1)
+async def search_products(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    category_id: Optional[UUID] = None,
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    try:
+        product_service = ProductService(db)
+        products = await product_service.search_products(q, limit, cursor, category_id)
+        return json_response(products)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/bulk", response_model=ProductImportResult)
+async def import_products(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        import_service = ProductImportService(db)
+        result = await import_service.import_products(
+            request.stream(), request.headers.get("content-type", "")
+        )
+        return result
+    except ValueError as e:
+        raise HTTPException(status_code=415, detail=str(e))
 
 
 @router.get("/{product_id}", response_model=ProductRead)
+@query_budget(3)
 async def get_product(
     product_id: UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_async_db),
 ):
     try:
         product_service = ProductService(db)
-        product = await product_service.get_product_by_id(product_id)
+        version = await product_service.get_product_version(product_id)
+        etag = make_etag("product", product_id, *version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        product = await product_service.get_product_by_id(product_id, version)
+        response.headers["ETag"] = etag
         return product
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
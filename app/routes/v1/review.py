@@ -1,11 +1,14 @@
-from typing import List
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_async_db
-from app.schema.review import ReviewCreate, ReviewRead, ReviewUpdate
+from app.db.query_counter import query_budget
+from app.db.session import get_async_db, get_async_read_db
+from app.routes.responses import json_response
+from app.schema.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from app.schema.review import ReviewCreate, ReviewRead, ReviewSort, ReviewUpdate
 from app.services.review import ReviewService
 
 router = APIRouter(prefix="/review", tags=["review"])
@@ -24,22 +27,39 @@ async def create_review(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/", response_model=List[ReviewRead])
+@router.get("/", response_model=Page[ReviewRead])
+@query_budget(1)
 async def list_reviews(
-    db: AsyncSession = Depends(get_async_db),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    sort: ReviewSort = ReviewSort.CREATED_AT,
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    review_service = ReviewService(db)
-    reviews = await review_service.list_reviews()
-    return reviews
+    try:
+        review_service = ReviewService(db)
+        reviews = await review_service.list_reviews(None, limit, cursor, sort)
+        return json_response(reviews)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/{product_id}", response_model=List[ReviewRead])
-async def get_review(product_id: UUID, db: AsyncSession = Depends(get_async_db)):
-    review_service = ReviewService(db)
-    review = await review_service.list_reviews(product_id)
-    if not review:
+@router.get("/{product_id}", response_model=Page[ReviewRead])
+@query_budget(1)
+async def get_review(
+    product_id: UUID,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    sort: ReviewSort = ReviewSort.CREATED_AT,
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    try:
+        review_service = ReviewService(db)
+        review = await review_service.list_reviews(product_id, limit, cursor, sort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not review.items and cursor is None:
         raise HTTPException(status_code=404, detail="Review not found")
-    return review
+    return json_response(review)
 
 
 @router.put("/{review_id}", response_model=ReviewUpdate)
@@ -0,0 +1,20 @@
+from functools import lru_cache
+from typing import Any, Iterable, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.engine import Row
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+def validate_list(model: type[ModelT], objects: Iterable[Any]) -> list[ModelT]:
+    return type_adapter(list[model]).validate_python(objects, from_attributes=True)
+
+
+def validate_rows(model: type[ModelT], rows: Iterable[Row]) -> list[ModelT]:
+    return type_adapter(list[model]).validate_python([row._asdict() for row in rows])
@@ -1,9 +1,10 @@
 import uuid
 from datetime import datetime
 from decimal import Decimal
+from enum import Enum as PyEnum
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.schema.product import ProductRead
 
@@ -34,3 +35,25 @@ class CartItemRead(BaseModel):
     user_id: Optional[uuid.UUID] = None
 
     model_config = ConfigDict(from_attributes=True, strict=True)
+
+
+class CartItemAction(str, PyEnum):
+    ADD = "add"
+    SET = "set"
+    REMOVE = "remove"
+
+
+class CartItemOperation(BaseModel):
+    action: CartItemAction
+    product_id: uuid.UUID
+    quantity: Optional[int] = Field(None, ge=1)
+
+    @model_validator(mode="after")
+    def validate_quantity(self) -> "CartItemOperation":
+        if self.action != CartItemAction.REMOVE and self.quantity is None:
+            raise ValueError(f"Quantity is required for '{self.action.value}'")
+        return self
+
+
+class CartItemBatch(BaseModel):
+    operations: list[CartItemOperation] = Field(..., min_length=1, max_length=100)
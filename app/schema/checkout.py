@@ -0,0 +1,28 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.models import OrderStatus
+
+
+class CheckoutCreate(BaseModel):
+    shipping_address_id: UUID
+    billing_address_id: Optional[UUID] = None
+
+
+class CheckoutItemRead(BaseModel):
+    product_id: UUID
+    quantity: int
+    price_snapshot: Decimal
+
+
+class CheckoutRead(BaseModel):
+    order_id: UUID
+    user_id: UUID
+    status: OrderStatus
+    total_price: Decimal
+    items: list[CheckoutItemRead]
+    created_at: datetime
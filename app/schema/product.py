@@ -1,14 +1,43 @@
 import uuid
 from datetime import datetime
+from enum import Enum as PyEnum
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from app.schema.category import CategoryRead
 
 MIN_DESCRIPTION_LENGTH = 2
 
 
+class ProductSort(str, PyEnum):
+    CREATED_AT = "created_at"
+    PRICE = "price"
+
+
+class SortOrder(str, PyEnum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class ProductFilter(BaseModel):
+    category_id: Optional[uuid.UUID] = None
+    min_price: Optional[float] = Field(None, ge=0)
+    max_price: Optional[float] = Field(None, ge=0)
+    is_active: Optional[bool] = None
+    in_stock: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def validate_price_range(self) -> "ProductFilter":
+        if (
+            self.min_price is not None
+            and self.max_price is not None
+            and self.min_price > self.max_price
+        ):
+            raise ValueError("min_price must not be greater than max_price")
+        return self
+
+
 class ProductBase(BaseModel):
     name: str = Field(..., min_length=2, max_length=255)
     description: Optional[str] = Field(None, max_length=255)
@@ -18,8 +47,8 @@ class ProductBase(BaseModel):
 
     @field_validator("name", "description")
     @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        return v.strip()
+    def strip_whitespace(cls, v: Optional[str]) -> Optional[str]:
+        return v.strip() if v else v
 
     @field_validator("description")
     @classmethod
@@ -61,7 +90,40 @@ class ProductUpdate(BaseModel):
 class ProductRead(ProductBase):
     id: uuid.UUID
     category: CategoryRead
+    rating_count: int = 0
+    rating_sum: float = 0.0
+    rating_average: Optional[float] = None
+    rating_histogram: list[int] = Field(default_factory=lambda: [0] * 5)
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(strict=True, from_attributes=True)
+
+
+class ProductImportError(BaseModel):
+    row: int
+    detail: str
+
+
+class ProductImportResult(BaseModel):
+    inserted: int
+    failed: int
+    errors: list[ProductImportError] = []
+
+
+class CategoryFacet(BaseModel):
+    category_id: uuid.UUID
+    name: str
+    count: int
+
+
+class PriceFacet(BaseModel):
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    count: int
+
+
+class ProductFacets(BaseModel):
+    total: int
+    categories: list[CategoryFacet] = []
+    price_ranges: list[PriceFacet] = []
@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum as PyEnum
 from typing import Optional
 from uuid import UUID
 
@@ -9,6 +10,11 @@ MAX_RATING = 5.0
 MAX_COMMENT_LENGTH = 1000
 
 
+class ReviewSort(str, PyEnum):
+    CREATED_AT = "created_at"
+    RATING = "rating"
+
+
 class ReviewBase(BaseModel):
     rating: float = Field(..., ge=MIN_RATING, le=MAX_RATING)
     comment: Optional[str] = Field(None, max_length=MAX_COMMENT_LENGTH)
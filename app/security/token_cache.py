@@ -0,0 +1,65 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class TokenCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class TokenCache:
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.stats = TokenCacheStats()
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self.digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            expires_at, payload = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return payload
+
+    def set(self, token: str, payload: dict) -> None:
+        expires_at = payload.get("exp")
+        if self.maxsize <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        key = self.digest(token)
+        with self._lock:
+            self._entries[key] = (float(expires_at), payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -2,55 +2,100 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
-from app.models import CartItem, Product, Cart
+from app.db.unit_of_work import UnitOfWork
+from app.repository.cart import CartRepository
 from app.repository.cart_item import CartItemRepository
-from app.schema.cart_item import CartItemCreate, CartItemRead
+from app.schema.cart import CartRead
+from app.schema.cart_item import (
+    CartItemAction,
+    CartItemBatch,
+    CartItemCreate,
+    CartItemOperation,
+    CartItemRead,
+)
+
+
+def fold_operations(
+    operations: list[CartItemOperation],
+) -> tuple[dict[UUID, int], dict[UUID, int], set[UUID]]:
+    """Collapse operations, in order, into increments, absolute sets and removals."""
+    increments: dict[UUID, int] = {}
+    quantities: dict[UUID, int] = {}
+    removals: set[UUID] = set()
+
+    for operation in operations:
+        product_id = operation.product_id
+        if operation.action == CartItemAction.REMOVE:
+            increments.pop(product_id, None)
+            quantities.pop(product_id, None)
+            removals.add(product_id)
+        elif operation.action == CartItemAction.SET:
+            increments.pop(product_id, None)
+            removals.discard(product_id)
+            quantities[product_id] = operation.quantity
+        elif product_id in quantities:
+            quantities[product_id] += operation.quantity
+        elif product_id in removals:
+            removals.discard(product_id)
+            quantities[product_id] = operation.quantity
+        else:
+            increments[product_id] = increments.get(product_id, 0) + operation.quantity
+
+    return increments, quantities, removals
+
 
 class CartItemService:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
         self.cart_item_repository = CartItemRepository(db)
+        self.cart_repository = CartRepository(db)
 
     async def create_cart_item(self, cart_item_data: CartItemCreate) -> CartItemRead:
-        # First get the cart to check user_id
-        cart_stmt = select(Cart).where(Cart.id == cart_item_data.cart_id)
-        cart_result = await self.db.execute(cart_stmt)
-        cart = cart_result.scalar_one_or_none()
-        if not cart:
-            raise HTTPException(status_code=404, detail="Cart not found")
-
-        stmt = select(CartItem).where(
-            CartItem.cart_id == cart_item_data.cart_id,
-            CartItem.product_id == cart_item_data.product_id
-        ).options(
-            selectinload(CartItem.product).selectinload(Product.category)
-        )
-
-        result = await self.db.execute(stmt)
-        existing_item = result.scalar_one_or_none()
-
-        if existing_item:
-            existing_item.quantity += cart_item_data.quantity
-            await self.db.commit()
-            await self.db.refresh(existing_item)
-            cart_item_read = CartItemRead.model_validate(existing_item, from_attributes=True)
-            cart_item_read.user_id = cart.user_id
-            return cart_item_read
-        
-        new_cart_item = CartItem(
-            cart_id=cart_item_data.cart_id,
-            product_id=cart_item_data.product_id,
-            quantity=cart_item_data.quantity,
-            price_snapshot=cart_item_data.price_snapshot,
-        )
-
-        self.db.add(new_cart_item)
-        await self.db.commit()
-        await self.db.refresh(new_cart_item)
-        cart_item_read = CartItemRead.model_validate(new_cart_item, from_attributes=True)
-        cart_item_read.user_id = cart.user_id
+        async with UnitOfWork(self.db):
+            try:
+                row = await self.cart_item_repository.upsert_cart_item(cart_item_data)
+            except IntegrityError:
+                raise HTTPException(status_code=404, detail="Product not found")
+
+            if row is None:
+                raise HTTPException(status_code=404, detail="Cart not found")
+
+        cart_item, user_id = row
+        cart_item_read = CartItemRead.model_validate(cart_item, from_attributes=True)
+        cart_item_read.user_id = user_id
         return cart_item_read
+
+    async def apply_batch(self, cart_id: UUID, batch: CartItemBatch) -> CartRead:
+        increments, quantities, removals = fold_operations(batch.operations)
+
+        async with UnitOfWork(self.db):
+            if removals:
+                await self.cart_item_repository.delete_cart_items(cart_id, removals)
+            written: set[UUID] = set()
+            if quantities:
+                written |= await self.cart_item_repository.upsert_cart_items(
+                    cart_id, quantities, increment=False
+                )
+            if increments:
+                written |= await self.cart_item_repository.upsert_cart_items(
+                    cart_id, increments, increment=True
+                )
+
+            cart = await self.cart_repository.get_cart_with_items(cart_id)
+            if not cart:
+                raise HTTPException(status_code=404, detail="Cart not found")
+
+            missing = (quantities.keys() | increments.keys()) - written
+            if missing:
+                raise HTTPException(
+                    status_code=404,
+                    detail=(
+                        "Products not found: "
+                        f"{', '.join(sorted(map(str, missing)))}"
+                    ),
+                )
+
+        return CartRead.model_validate(cart)
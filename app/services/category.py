@@ -4,7 +4,9 @@ from uuid import UUID
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.unit_of_work import UnitOfWork
 from app.repository.category import CategoryRepository
+from app.schema.adapters import validate_list
 from app.schema.category import CategoryCreate, CategoryRead, CategoryUpdate
 
 
@@ -15,14 +17,14 @@ class CategoryService:
 
     async def create_category(self, category_data: CategoryCreate) -> CategoryRead:
         try:
-            new_category = await self.category_repository.create_category(category_data)
-            await self.db.commit()
-            await self.db.refresh(new_category)
+            async with UnitOfWork(self.db):
+                new_category = await self.category_repository.create_category(
+                    category_data
+                )
 
             return CategoryRead.model_validate(new_category, from_attributes=True)
 
         except IntegrityError as e:
-            await self.db.rollback()
             raise ValueError("Category creation failed due to integrity error") from e
 
     async def get_category_by_id(self, category_id: UUID) -> CategoryRead:
@@ -31,12 +33,13 @@ class CategoryService:
             raise ValueError("Category not found")
         return CategoryRead.model_validate(category, from_attributes=True)
 
+    async def get_categories_version(self) -> tuple:
+        version = await self.category_repository.get_list_version()
+        return tuple(version)
+
     async def list_categories(self) -> List[CategoryRead]:
         categories = await self.category_repository.list_categories()
-        return [
-            CategoryRead.model_validate(category, from_attributes=True)
-            for category in categories
-        ]
+        return validate_list(CategoryRead, categories)
 
     async def update_category(
         self, category_id: UUID, category_data: CategoryUpdate
@@ -45,9 +48,10 @@ class CategoryService:
         if not category:
             raise ValueError("Category not found")
 
-        updated_category = await self.category_repository.update(
-            category, category_data
-        )
+        async with UnitOfWork(self.db):
+            updated_category = await self.category_repository.update(
+                category, category_data
+            )
         return CategoryRead.model_validate(updated_category, from_attributes=True)
 
     async def delete_category(self, category_id: UUID) -> None:
@@ -55,6 +59,6 @@ class CategoryService:
         if not category:
             raise ValueError("Category not found")
 
-        await self.category_repository.delete(category)
-        await self.db.commit()
+        async with UnitOfWork(self.db):
+            await self.category_repository.delete(category)
         return {"detail": "Category deleted successfully"}
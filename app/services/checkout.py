@@ -0,0 +1,73 @@
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.unit_of_work import UnitOfWork
+from app.models import OrderStatus
+from app.repository.cart import CartRepository
+from app.repository.order import OrderRepository
+from app.schema.checkout import CheckoutCreate, CheckoutItemRead, CheckoutRead
+
+
+class CheckoutService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.cart_repository = CartRepository(db)
+        self.order_repository = OrderRepository(db)
+
+    async def checkout(
+        self, cart_id: UUID, checkout_data: CheckoutCreate
+    ) -> CheckoutRead:
+        shipping_address_id = checkout_data.shipping_address_id
+        billing_address_id = checkout_data.billing_address_id or shipping_address_id
+
+        async with UnitOfWork(self.db):
+            claim = await self.cart_repository.claim_for_checkout(
+                cart_id, shipping_address_id, billing_address_id
+            )
+            if claim is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Cart with ID {cart_id} not found or already checked out.",
+                )
+            if not claim.has_items:
+                raise HTTPException(status_code=400, detail="Cart is empty")
+            if not claim.shipping_ok:
+                raise HTTPException(
+                    status_code=404, detail="Shipping address not found"
+                )
+            if not claim.billing_ok:
+                raise HTTPException(status_code=404, detail="Billing address not found")
+
+            rows = await self.order_repository.create_from_cart(
+                cart_id, claim.user_id, shipping_address_id, billing_address_id
+            )
+            if not rows:
+                raise HTTPException(status_code=400, detail="Cart is empty")
+
+            reserved = set(rows[0].reserved or ())
+            unavailable = {row.product_id for row in rows} - reserved
+            if unavailable:
+                raise HTTPException(
+                    status_code=409,
+                    detail="Insufficient stock for products: "
+                    + ", ".join(sorted(str(product_id) for product_id in unavailable)),
+                )
+
+        order = rows[0]
+        return CheckoutRead(
+            order_id=order.order_id,
+            user_id=claim.user_id,
+            status=OrderStatus.PENDING,
+            total_price=order.total_price,
+            items=[
+                CheckoutItemRead(
+                    product_id=row.product_id,
+                    quantity=row.quantity,
+                    price_snapshot=row.price_snapshot,
+                )
+                for row in rows
+            ],
+            created_at=order.created_at,
+        )
@@ -1,49 +1,205 @@
+import os
+import random
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
+from dotenv import load_dotenv
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import CacheBackend, get_cache
+from app.db.unit_of_work import UnitOfWork
 from app.repository.category import CategoryRepository
 from app.repository.product import ProductRepository
-from app.schema.product import ProductCreate, ProductRead, ProductUpdate
+from app.schema.adapters import validate_list
+from app.schema.pagination import Page, decode_cursor, encode_cursor
+from app.schema.product import (
+    CategoryFacet,
+    PriceFacet,
+    ProductCreate,
+    ProductFacets,
+    ProductFilter,
+    ProductRead,
+    ProductSort,
+    ProductUpdate,
+    SortOrder,
+)
+
+load_dotenv()
+
+PRODUCT_CACHE_TTL = int(os.getenv("PRODUCT_CACHE_TTL", 300))
+PRODUCT_CACHE_TTL_JITTER = int(os.getenv("PRODUCT_CACHE_TTL_JITTER", 60))
+PRODUCT_FACETS_CACHE_TTL = int(os.getenv("PRODUCT_FACETS_CACHE_TTL", 60))
+PRODUCT_PRICE_FACETS = sorted(
+    float(boundary)
+    for boundary in os.getenv("PRODUCT_PRICE_FACETS", "10,25,50,100,250").split(",")
+)
+
+
+def product_cache_key(product_id: UUID) -> str:
+    return f"product:{product_id}"
+
+
+def product_facets_cache_key(filters: ProductFilter) -> str:
+    return f"product-facets:{filters.model_dump_json()}"
 
 
 class ProductService:
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, cache: Optional[CacheBackend] = None) -> None:
         self.db = db
+        self.cache = cache if cache is not None else get_cache()
         self.product_repository = ProductRepository(db)
         self.category_repository = CategoryRepository(db)
 
     async def create_product(self, product_data: ProductCreate) -> ProductRead:
-        category = await self.category_repository.get_by_id(product_data.category_id)
+        category = await self.category_repository.get(product_data.category_id)
         if not category:
             raise ValueError("Category not found")
 
         try:
-            new_product = await self.product_repository.create_product(
-                product_data, category.id
-            )
-            await self.db.commit()
-            await self.db.refresh(new_product)
+            async with UnitOfWork(self.db):
+                new_product = await self.product_repository.create_product(
+                    product_data, category.id
+                )
 
             return ProductRead.model_validate(new_product, from_attributes=True)
 
         except IntegrityError as e:
-            await self.db.rollback()
             raise ValueError("Product creation failed due to integrity error") from e
 
-    async def get_product_by_id(self, product_id: UUID) -> ProductRead:
+    async def get_product_version(self, product_id: UUID) -> tuple:
+        version = await self.product_repository.get_version(product_id)
+        if not version:
+            raise ValueError("Product not found")
+        return tuple(version)
+
+    async def get_product_by_id(
+        self, product_id: UUID, version: Optional[tuple] = None
+    ) -> ProductRead:
+        key = product_cache_key(product_id)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            product_read = ProductRead.model_validate_json(cached)
+            cached_version = (product_read.updated_at, product_read.category.updated_at)
+            if version is None or cached_version == version:
+                return product_read
+
         product = await self.product_repository.get_by_id(product_id)
         if not product:
             raise ValueError("Product not found")
-        return ProductRead.model_validate(product, from_attributes=True)
 
-    async def list_products(self) -> list[ProductRead]:
-        products = await self.product_repository.list_products()
-        return [
-            ProductRead.model_validate(product, from_attributes=True)
-            for product in products
-        ]
+        product_read = ProductRead.model_validate(product, from_attributes=True)
+        ttl = PRODUCT_CACHE_TTL + random.randint(0, PRODUCT_CACHE_TTL_JITTER)
+        await self.cache.set(key, product_read.model_dump_json().encode(), ttl)
+        return product_read
+
+    async def list_products(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[ProductFilter] = None,
+        sort: ProductSort = ProductSort.CREATED_AT,
+        order: SortOrder = SortOrder.ASC,
+    ) -> Page[ProductRead]:
+        after = None
+        if cursor:
+            cursor_sort, cursor_order, value, product_id = decode_cursor(cursor, 4)
+            try:
+                if (cursor_sort, cursor_order) != (sort.value, order.value):
+                    raise ValueError("cursor belongs to another ordering")
+                if sort == ProductSort.PRICE:
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        raise TypeError("price cursor must be a number")
+                    after = (float(value), UUID(product_id))
+                else:
+                    after = (datetime.fromisoformat(value), UUID(product_id))
+            except (TypeError, ValueError) as e:
+                raise ValueError("Invalid cursor") from e
+
+        products = await self.product_repository.list_products(
+            limit + 1, after, filters, sort, order
+        )
+        next_cursor = None
+        if len(products) > limit:
+            products = products[:limit]
+            last = products[-1]
+            next_cursor = encode_cursor(
+                sort.value, order.value, getattr(last, sort.value), last.id
+            )
+
+        return Page[ProductRead](
+            items=validate_list(ProductRead, products),
+            next_cursor=next_cursor,
+        )
+
+    async def search_products(
+        self,
+        query: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        category_id: Optional[UUID] = None,
+    ) -> Page[ProductRead]:
+        offset = 0
+        if cursor:
+            (offset,) = decode_cursor(cursor, 1)
+            if type(offset) is not int or offset < 0:
+                raise ValueError("Invalid cursor")
+
+        products = await self.product_repository.search_products(
+            query, limit + 1, offset, category_id
+        )
+        next_cursor = None
+        if len(products) > limit:
+            products = products[:limit]
+            next_cursor = encode_cursor(offset + limit)
+
+        return Page[ProductRead](
+            items=validate_list(ProductRead, products),
+            next_cursor=next_cursor,
+        )
+
+    async def get_facets(self, filters: ProductFilter) -> ProductFacets:
+        key = product_facets_cache_key(filters)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return ProductFacets.model_validate_json(cached)
+
+        rows = await self.product_repository.facet_counts(filters, PRODUCT_PRICE_FACETS)
+        bounds = [None, *PRODUCT_PRICE_FACETS, None]
+        price_counts = dict.fromkeys(range(len(PRODUCT_PRICE_FACETS) + 1), 0)
+        categories = []
+        for row in rows:
+            if row.is_price_facet:
+                price_counts[row.bucket] = row.price_count
+            else:
+                categories.append(
+                    CategoryFacet(
+                        category_id=row.category_id,
+                        name=row.name,
+                        count=row.category_count,
+                    )
+                )
+
+        categories.sort(key=lambda facet: facet.name)
+        facets = ProductFacets(
+            total=sum(
+                facet.count
+                for facet in categories
+                if filters.category_id in (None, facet.category_id)
+            ),
+            categories=categories,
+            price_ranges=[
+                PriceFacet(
+                    min_price=bounds[bucket], max_price=bounds[bucket + 1], count=count
+                )
+                for bucket, count in price_counts.items()
+            ],
+        )
+        await self.cache.set(
+            key, facets.model_dump_json().encode(), PRODUCT_FACETS_CACHE_TTL
+        )
+        return facets
 
     async def update_product(
         self, product_id: UUID, product_data: ProductUpdate
@@ -52,7 +208,11 @@ class ProductService:
         if not product:
             raise ValueError("Product not found")
 
-        updated_product = await self.product_repository.update(product, product_data)
+        async with UnitOfWork(self.db):
+            updated_product = await self.product_repository.update(
+                product, product_data
+            )
+        await self.cache.delete(product_cache_key(product_id))
         return ProductRead.model_validate(updated_product, from_attributes=True)
 
     async def delete_product(self, product_id: UUID) -> None:
@@ -60,6 +220,7 @@ class ProductService:
         if not product:
             raise ValueError("Product not found")
 
-        await self.product_repository.delete(product)
-        await self.db.commit()
+        async with UnitOfWork(self.db):
+            await self.product_repository.delete(product)
+        await self.cache.delete(product_cache_key(product_id))
         return {"detail": "Product deleted successfully"}
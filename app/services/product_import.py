@@ -0,0 +1,185 @@
+import csv
+import os
+import uuid
+from collections import deque
+from typing import AsyncIterator, Iterator
+
+from dotenv import load_dotenv
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repository.product import ProductRepository
+from app.schema.product import ProductCreate, ProductImportError, ProductImportResult
+
+load_dotenv()
+
+PRODUCT_IMPORT_CHUNK_SIZE = int(os.getenv("PRODUCT_IMPORT_CHUNK_SIZE", 5000))
+PRODUCT_IMPORT_MAX_ERRORS = int(os.getenv("PRODUCT_IMPORT_MAX_ERRORS", 1000))
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson")
+CSV_CONTENT_TYPES = ("text/csv",)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            yield buffer[start:end].decode(errors="replace").rstrip("\r")
+            start = end + 1
+        del buffer[:start]
+    if buffer:
+        yield buffer.decode(errors="replace").rstrip("\r")
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors(include_url=False)
+    )
+
+
+class ProductImportService:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.product_repository = ProductRepository(db)
+        self.known_category_ids: set[uuid.UUID] = set()
+
+    async def import_products(
+        self, chunks: AsyncIterator[bytes], content_type: str
+    ) -> ProductImportResult:
+        media_type = content_type.split(";")[0].strip().lower()
+        if media_type in NDJSON_CONTENT_TYPES:
+            rows = self._parse_ndjson(iter_lines(chunks))
+        elif media_type in CSV_CONTENT_TYPES:
+            rows = self._parse_csv(iter_lines(chunks))
+        else:
+            raise ValueError("Unsupported content type, expected NDJSON or CSV")
+
+        result = ProductImportResult(inserted=0, failed=0)
+        await self.product_repository.create_import_staging_table()
+
+        chunk: list[tuple[int, ProductCreate]] = []
+        async for row_number, product in rows:
+            if isinstance(product, str):
+                self._add_error(result, row_number, product)
+                continue
+            if product.price <= 0:
+                self._add_error(result, row_number, "Price must be positive")
+                continue
+
+            chunk.append((row_number, product))
+            if len(chunk) >= PRODUCT_IMPORT_CHUNK_SIZE:
+                await self._stage_chunk(chunk, result)
+                chunk = []
+        if chunk:
+            await self._stage_chunk(chunk, result)
+
+        result.inserted = await self.product_repository.insert_from_import_staging()
+        await self.db.commit()
+        result.errors.sort(key=lambda error: error.row)
+        return result
+
+    async def _stage_chunk(
+        self, chunk: list[tuple[int, ProductCreate]], result: ProductImportResult
+    ) -> None:
+        unknown = {p.category_id for _, p in chunk} - self.known_category_ids
+        if unknown:
+            self.known_category_ids |= (
+                await self.product_repository.existing_category_ids(unknown)
+            )
+
+        records = []
+        for row_number, product in chunk:
+            if product.category_id not in self.known_category_ids:
+                self._add_error(result, row_number, "Category not found")
+                continue
+            records.append(
+                (
+                    product.name,
+                    product.description,
+                    product.stock,
+                    product.price,
+                    product.is_active,
+                    product.category_id,
+                )
+            )
+        if records:
+            await self.product_repository.copy_to_import_staging(records)
+
+    @staticmethod
+    def _add_error(result: ProductImportResult, row: int, detail: str) -> None:
+        result.failed += 1
+        if len(result.errors) < PRODUCT_IMPORT_MAX_ERRORS:
+            result.errors.append(ProductImportError(row=row, detail=detail))
+
+    @staticmethod
+    async def _parse_ndjson(
+        lines: AsyncIterator[str],
+    ) -> AsyncIterator[tuple[int, ProductCreate | str]]:
+        row_number = 0
+        async for line in lines:
+            row_number += 1
+            if not line.strip():
+                continue
+            try:
+                yield row_number, ProductCreate.model_validate_json(line)
+            except ValidationError as e:
+                yield row_number, _format_validation_error(e)
+
+    @staticmethod
+    async def _parse_csv(
+        lines: AsyncIterator[str],
+    ) -> AsyncIterator[tuple[int, ProductCreate | str]]:
+        feed = _LineFeed()
+        reader = csv.reader(feed)
+        header = None
+        async for record in _csv_records(lines):
+            feed.lines.extend(record)
+            row_number = reader.line_num + 1
+            try:
+                values = next(reader)
+            except csv.Error as e:
+                yield row_number, str(e)
+                continue
+            if not "".join(values).strip():
+                continue
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            if len(values) != len(header):
+                yield row_number, f"Expected {len(header)} columns, got {len(values)}"
+                continue
+            data = {name: value for name, value in zip(header, values) if value != ""}
+            try:
+                yield row_number, ProductCreate.model_validate(data)
+            except ValidationError as e:
+                yield row_number, _format_validation_error(e)
+
+
+class _LineFeed:
+    def __init__(self) -> None:
+        self.lines: deque[str] = deque()
+
+    def __iter__(self) -> Iterator[str]:
+        return self
+
+    def __next__(self) -> str:
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+async def _csv_records(lines: AsyncIterator[str]) -> AsyncIterator[list[str]]:
+    # An odd number of quotes means a quoted field continues on the next line.
+    record: list[str] = []
+    quotes = 0
+    async for line in lines:
+        record.append(line + "\n")
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield record
+            record, quotes = [], 0
+    if record:
+        yield record
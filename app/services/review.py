@@ -1,92 +1,129 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
-from app.models import Product, Review, User
+from app.cache import CacheBackend, get_cache
+from app.db.unit_of_work import UnitOfWork
+from app.models import Review
+from app.models.review import rating_star
+from app.repository.product import ProductRepository
 from app.repository.review import ReviewRepository
-from app.schema.review import ReviewCreate, ReviewUpdate
+from app.schema.adapters import validate_rows
+from app.schema.pagination import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
+from app.schema.review import ReviewCreate, ReviewRead, ReviewSort, ReviewUpdate
+from app.services.product import product_cache_key
 
 
 class ReviewService:
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(self, db: AsyncSession, cache: Optional[CacheBackend] = None) -> None:
         self.db = db
+        self.cache = cache if cache is not None else get_cache()
         self.review_repository = ReviewRepository(db)
+        self.product_repository = ProductRepository(db)
 
     async def create_review(self, review_data: ReviewCreate) -> Review:
-        product = await self.db.execute(
-            select(Product).where(Product.id == review_data.product_id)
-        )
-        product_result = product.scalar_one_or_none()
-
-        if product_result is None:
-            raise ValueError(f"Product with id {review_data.product_id} does not exist")
-
-        user = await self.db.execute(select(User).where(User.id == review_data.user_id))
-        user_result = user.scalar_one_or_none()
-
-        if user_result is None:
-            raise ValueError(f"User with id {review_data.user_id} does not exist")
-
-        db_review = Review(
-            product_id=review_data.product_id,
-            user_id=review_data.user_id,
-            rating=review_data.rating,
-            comment=review_data.comment,
-        )
-        self.db.add(db_review)
-        await self.db.commit()
-        await self.db.refresh(db_review)
-
-        stmt = (
-            select(Review)
-            .options(
-                selectinload(Review.product).selectinload(Product.category),
-                selectinload(Review.user).selectinload(User.addresses),
+        async with UnitOfWork(self.db):
+            updated = await self.product_repository.apply_rating_change(
+                review_data.product_id,
+                count_delta=1,
+                sum_delta=review_data.rating,
+                star_deltas={rating_star(review_data.rating): 1},
             )
-            .where(Review.id == db_review.id)
-        )
-
-        result = await self.db.execute(stmt)
-        db_review = result.scalar_one()
+            if not updated:
+                raise ValueError(
+                    f"Product with id {review_data.product_id} does not exist"
+                )
+            db_review = await self.review_repository.create_review(review_data)
+        await self.cache.delete(product_cache_key(review_data.product_id))
 
         return db_review
 
-    async def list_reviews(self, product_id: Optional[UUID] = None) -> List[Review]:
-        stmt = select(Review).options(
-            selectinload(Review.product).selectinload(Product.category),
-            selectinload(Review.user).selectinload(User.addresses),
+    async def list_reviews(
+        self,
+        product_id: Optional[UUID] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        sort: ReviewSort = ReviewSort.CREATED_AT,
+    ) -> Page[ReviewRead]:
+        before = None
+        if cursor:
+            value, review_id = decode_cursor(cursor, 2)
+            try:
+                if sort == ReviewSort.RATING:
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        raise TypeError("rating cursor must be a number")
+                    before = (float(value), UUID(review_id))
+                else:
+                    before = (datetime.fromisoformat(value), UUID(review_id))
+            except (TypeError, ValueError) as e:
+                raise ValueError("Invalid cursor") from e
+
+        rows = await self.review_repository.list_review_rows(
+            limit + 1, sort, product_id, before
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(getattr(last, sort.value), last.id)
+
+        return Page[ReviewRead](
+            items=validate_rows(ReviewRead, rows),
+            next_cursor=next_cursor,
         )
-
-        if product_id:
-            stmt = stmt.where(Review.product_id == product_id)
-
-        result = await self.db.execute(stmt)
-        return result.scalars().all()
 
     async def update_review(self, review_id: UUID, review_data: ReviewUpdate) -> Review:
-        db_review = await self.review_repository.get_review_by_id(review_id)
-        if not db_review:
-            raise ValueError("Review not found")
-
-        if review_data.rating is not None:
-            db_review.rating = review_data.rating
-        if review_data.comment is not None:
-            db_review.comment = review_data.comment
-
-        await self.db.commit()
-        await self.db.refresh(db_review)
+        async with UnitOfWork(self.db):
+            db_review = await self.review_repository.get_review_by_id(
+                review_id, for_update=True
+            )
+            if not db_review:
+                raise ValueError("Review not found")
+
+            old_rating = db_review.rating
+            if review_data.rating is not None:
+                db_review.rating = review_data.rating
+            if review_data.comment is not None:
+                db_review.comment = review_data.comment
+
+            rating_changed = db_review.rating != old_rating
+            if rating_changed:
+                star_deltas = {rating_star(old_rating): -1}
+                new_star = rating_star(db_review.rating)
+                star_deltas[new_star] = star_deltas.get(new_star, 0) + 1
+                await self.product_repository.apply_rating_change(
+                    db_review.product_id,
+                    count_delta=0,
+                    sum_delta=db_review.rating - old_rating,
+                    star_deltas=star_deltas,
+                )
+
+        if rating_changed:
+            await self.cache.delete(product_cache_key(db_review.product_id))
 
         return db_review
 
     async def delete_review(self, review_id: UUID) -> None:
-        db_review = await self.review_repository.get_review_by_id(review_id)
-
-        if not db_review:
-            raise HTTPException(status_code=404, detail="Review not found")
-
-        await self.db.delete(db_review)
-        await self.db.commit()
+        async with UnitOfWork(self.db):
+            db_review = await self.review_repository.get_review_by_id(
+                review_id, for_update=True
+            )
+            if not db_review:
+                raise HTTPException(status_code=404, detail="Review not found")
+
+            await self.db.delete(db_review)
+            await self.product_repository.apply_rating_change(
+                db_review.product_id,
+                count_delta=-1,
+                sum_delta=-db_review.rating,
+                star_deltas={rating_star(db_review.rating): -1},
+            )
+        await self.cache.delete(product_cache_key(db_review.product_id))
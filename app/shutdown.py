@@ -0,0 +1,20 @@
+import os
+import time
+
+from app.configs.logger import logger, remove_file_sink
+from app.db.session import dispose_engines
+from app.metrics import mark_process_dead
+from app.models.value_objects.password import shutdown_executor
+
+
+async def shutdown() -> None:
+    start = time.perf_counter()
+    await dispose_engines()
+    shutdown_executor()
+    mark_process_dead(os.getpid())
+
+    logger.bind(
+        duration=round((time.perf_counter() - start) * 1000, 3),
+    ).info("Shutdown completed")
+    await logger.complete()
+    await remove_file_sink()
@@ -0,0 +1,89 @@
+import asyncio
+import os
+import time
+from typing import Any
+
+from dotenv import load_dotenv
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.orm import configure_mappers
+
+from app.configs.logger import logger
+from app.db import session
+from app.schema.adapters import type_adapter
+from app.schema.pagination import Page
+
+load_dotenv()
+
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+DB_WARMUP_QUERIES = [
+    query.strip()
+    for query in os.getenv("DB_WARMUP_QUERIES", "").split(";")
+    if query.strip()
+]
+
+
+def warm_serializers(app: FastAPI) -> int:
+    response_models = {
+        route.response_model
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.response_model is not None
+    }
+    for response_model in response_models:
+        warm_type(response_model)
+    return len(response_models)
+
+
+def warm_type(tp: Any) -> None:
+    type_adapter(tp)
+    if isinstance(tp, type) and issubclass(tp, Page):
+        type_adapter(tp.model_fields["items"].annotation)
+
+
+async def fill_pool(async_engine: AsyncEngine, queries: list[str]) -> int:
+    results = await asyncio.gather(
+        *(async_engine.connect() for _ in range(async_engine.pool.size())),
+        return_exceptions=True,
+    )
+    connections = [result for result in results if isinstance(result, AsyncConnection)]
+    try:
+        results += await asyncio.gather(
+            *(_run_queries(connection, queries) for connection in connections),
+            return_exceptions=True,
+        )
+    finally:
+        await asyncio.gather(*(connection.close() for connection in connections))
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return len(connections)
+
+
+async def _run_queries(connection: AsyncConnection, queries: list[str]) -> None:
+    for query in queries:
+        await connection.execute(text(query))
+    await connection.rollback()
+
+
+async def warmup(app: FastAPI, queries: list[str] = DB_WARMUP_QUERIES) -> None:
+    start = time.perf_counter()
+    configure_mappers()
+    serializers = warm_serializers(app)
+    connections = await fill_pool(session.engine, queries)
+
+    replica_connections = 0
+    if session.replica_engine is not None:
+        try:
+            replica_connections = await fill_pool(session.replica_engine, queries)
+        except (DBAPIError, OSError) as e:
+            logger.warning(f"Read replica warmup failed: {e}")
+
+    logger.bind(
+        serializers=serializers,
+        connections=connections,
+        replica_connections=replica_connections,
+        duration=round((time.perf_counter() - start) * 1000, 3),
+    ).info("Warmup completed")
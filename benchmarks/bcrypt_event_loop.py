@@ -0,0 +1,94 @@
+"""Event loop latency during a login burst, with blocking and offloaded bcrypt.
+
+Runs an in-process app with an unrelated ``/ping`` endpoint and a login-like
+endpoint that verifies a bcrypt hash either inline (``Password.verify``) or
+through the bounded executor (``Password.verify_async``). While a burst of
+logins is in flight, ``/ping`` is polled and its latency percentiles reported.
+
+    python -m benchmarks.bcrypt_event_loop --logins 50 --pings 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.models.value_objects import Password
+
+RAW_PASSWORD = "Valid1@Password"
+PING_INTERVAL = 0.005
+
+
+def build_app(hashed_password: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/login/blocking")
+    async def login_blocking():
+        return {"ok": Password(raw=RAW_PASSWORD).verify(hashed_password)}
+
+    @app.post("/login/offloaded")
+    async def login_offloaded():
+        return {"ok": await Password(raw=RAW_PASSWORD).verify_async(hashed_password)}
+
+    return app
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def run_scenario(app: FastAPI, mode: str, logins: int, pings: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def ping_loop() -> list[float]:
+            # Latency is measured from each ping's scheduled start, so time the
+            # request spent waiting for a blocked event loop is included.
+            latencies = []
+            started = time.perf_counter()
+            for i in range(pings):
+                scheduled = started + i * PING_INTERVAL
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                await client.get("/ping")
+                latencies.append((time.perf_counter() - scheduled) * 1000)
+            return latencies
+
+        burst = [client.post(f"/login/{mode}") for _ in range(logins)]
+        latencies, *_ = await asyncio.gather(ping_loop(), *burst)
+
+    return {
+        "mode": mode,
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+    }
+
+
+async def main(logins: int, pings: int) -> None:
+    hashed_password = Password(raw=RAW_PASSWORD).hash()
+    app = build_app(hashed_password)
+    for mode in ("blocking", "offloaded"):
+        result = await run_scenario(app, mode, logins, pings)
+        print(
+            f"{result['mode']:>10}: /ping p50={result['p50_ms']}ms "
+            f"p99={result['p99_ms']}ms max={result['max_ms']}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--pings", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.pings))
@@ -0,0 +1,184 @@
+"""Concurrent checkouts competing for one hot SKU.
+
+Seeds a product with limited stock and one cart per buyer. Every cart holds one
+unit of the hot SKU, and half of them also hold two shared "bundle" products.
+All checkouts then run at once through CheckoutService. The report checks that
+stock was never oversold, that no checkout deadlocked, and prints latency
+percentiles.
+
+Runs against DATABASE_URL and leaves the seeded rows in place.
+
+    python -m benchmarks.checkout_concurrency --buyers 400 --stock 100
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from collections import Counter
+
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.session import DATABASE_URL, create_engine
+from app.schema.checkout import CheckoutCreate
+from app.services.checkout import CheckoutService
+
+
+async def seed(sessionmaker, buyers: int, stock: int) -> tuple[uuid.UUID, list]:
+    run = uuid.uuid4().hex[:8]
+    category_id, hot_id = uuid.uuid4(), uuid.uuid4()
+    bundle_ids = [uuid.uuid4(), uuid.uuid4()]
+    carts = []
+
+    async with sessionmaker() as db:
+        await db.execute(
+            text(
+                "INSERT INTO categories (id, name, description, created_at, "
+                "updated_at) VALUES (:id, :name, 'benchmark', now(), now())"
+            ),
+            {"id": category_id, "name": f"checkout-{run}"},
+        )
+        await db.execute(
+            text(
+                "INSERT INTO products (id, name, description, stock, price, "
+                "is_active, created_at, updated_at, category_id) VALUES "
+                "(:id, :name, 'benchmark', :stock, :price, true, now(), now(), "
+                ":category_id)"
+            ),
+            [
+                {
+                    "id": product_id,
+                    "name": f"{name}-{run}",
+                    "stock": product_stock,
+                    "price": price,
+                    "category_id": category_id,
+                }
+                for product_id, name, product_stock, price in [
+                    (hot_id, "hot", stock, 19.9),
+                    (bundle_ids[0], "bundle-a", buyers, 5),
+                    (bundle_ids[1], "bundle-b", buyers, 7.5),
+                ]
+            ],
+        )
+
+        users, addresses, cart_rows, items = [], [], [], []
+        for index in range(buyers):
+            user_id, address_id, cart_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+            users.append({"id": user_id, "email": f"buyer{index}-{run}@example.com"})
+            addresses.append({"id": address_id, "user_id": user_id})
+            cart_rows.append({"id": cart_id, "user_id": user_id})
+            products = [hot_id] + (
+                bundle_ids[:: 1 - 2 * (index % 2)] if index % 4 < 2 else []
+            )
+            items.extend(
+                {"cart_id": cart_id, "product_id": product_id}
+                for product_id in products
+            )
+            carts.append((cart_id, address_id))
+
+        await db.execute(
+            text(
+                "INSERT INTO users (id, email, full_name, hashed_password, "
+                "is_active, is_superuser, created_at, updated_at) VALUES "
+                "(:id, :email, 'Buyer', 'x', true, false, now(), now())"
+            ),
+            users,
+        )
+        await db.execute(
+            text(
+                "INSERT INTO addresses (id, user_id, street, city, state, country, "
+                "postal_code, is_default_shipping, is_default_billing, created_at, "
+                "updated_at) VALUES (:id, :user_id, 'Street', 'City', 'State', "
+                "'Country', '00000', true, true, now(), now())"
+            ),
+            addresses,
+        )
+        await db.execute(
+            text(
+                "INSERT INTO carts (id, user_id, created_at, updated_at, is_active, "
+                "is_checked_out) VALUES (:id, :user_id, now(), now(), true, false)"
+            ),
+            cart_rows,
+        )
+        await db.execute(
+            text(
+                "INSERT INTO cart_items (id, cart_id, product_id, quantity, "
+                "price_snapshot, created_at, updated_at) SELECT "
+                "gen_random_uuid(), :cart_id, :product_id, 1, price, now(), now() "
+                "FROM products WHERE id = :product_id"
+            ),
+            items,
+        )
+        await db.commit()
+
+    return hot_id, carts
+
+
+async def checkout(sessionmaker, cart_id, address_id) -> tuple[str, float]:
+    start = time.perf_counter()
+    async with sessionmaker() as db:
+        try:
+            await CheckoutService(db).checkout(
+                cart_id, CheckoutCreate(shipping_address_id=address_id)
+            )
+            outcome = "ok"
+        except HTTPException as e:
+            outcome = str(e.status_code)
+        except Exception as e:
+            outcome = type(e).__name__
+    return outcome, time.perf_counter() - start
+
+
+async def main(buyers: int, stock: int, concurrency: int) -> None:
+    engine = create_engine(
+        DATABASE_URL, pool_size=concurrency, max_overflow=0, pool_timeout=120
+    )
+    sessionmaker = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    try:
+        hot_id, carts = await seed(sessionmaker, buyers, stock)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(checkout(sessionmaker, *cart) for cart in carts)
+        )
+        elapsed = time.perf_counter() - start
+
+        async with sessionmaker() as db:
+            remaining = await db.scalar(
+                text("SELECT stock FROM products WHERE id = :id"), {"id": hot_id}
+            )
+            sold = await db.scalar(
+                text(
+                    "SELECT coalesce(sum(quantity), 0) FROM order_items "
+                    "WHERE product_id = :id"
+                ),
+                {"id": hot_id},
+            )
+    finally:
+        await engine.dispose()
+
+    outcomes = Counter(outcome for outcome, _ in results)
+    latencies = sorted(latency for _, latency in results)
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"checkouts: {buyers} in {elapsed:.2f}s ({buyers / elapsed:,.0f}/s)")
+    print(f" outcomes: {dict(outcomes)}")
+    print(
+        f"  latency: p50={quantiles[49] * 1000:.1f}ms p99={quantiles[98] * 1000:.1f}ms"
+    )
+    print(f"  hot sku: stock={stock} sold={sold} remaining={remaining}")
+    assert sold == stock - remaining == outcomes["ok"], "stock and orders disagree"
+    assert remaining >= 0, "oversold"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--buyers", type=int, default=400)
+    parser.add_argument("--stock", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.buyers, args.stock, args.concurrency))
@@ -0,0 +1,41 @@
+"""Throughput of verify_access_token with and without the decoded-token cache.
+
+python -m benchmarks.jwt_cache --iterations 20000
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+
+from app.security import security  # noqa: E402
+from app.security.token_cache import TokenCache  # noqa: E402
+
+
+def measure(iterations: int, token: str) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        security.verify_access_token(token)
+    return iterations / (time.perf_counter() - start)
+
+
+def main(iterations: int) -> None:
+    token = security.create_access_token({"sub": "benchmark-user"})
+
+    security.token_cache = TokenCache(maxsize=0)
+    uncached = measure(iterations, token)
+
+    security.token_cache = TokenCache(maxsize=security.JWT_CACHE_MAXSIZE)
+    cached = measure(iterations, token)
+
+    print(f"uncached: {uncached:,.0f} verifications/s")
+    print(f"  cached: {cached:,.0f} verifications/s ({cached / uncached:.1f}x)")
+    print(f"   stats: {security.token_cache.stats}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+    main(args.iterations)
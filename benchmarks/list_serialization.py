@@ -0,0 +1,141 @@
+"""Time to turn 10k ORM rows into a JSON list response, per serialization path.
+
+Compares the previous path with the shared bytes path used by the list routes:
+
+* ``response_model``: each row goes through ``Model.model_validate``. FastAPI
+  then validates the result against ``response_model`` again, converts it to
+  JSON-compatible python, and encodes it with ``json.dumps``.
+* ``json_response``: rows are validated once by a cached
+  ``TypeAdapter(list[Model])`` and dumped straight to bytes. ORM instances are
+  read by attribute; column-only result rows (reviews) are read as dicts.
+
+Rows are built in memory as transient ORM instances, or as result rows for
+reviews, so no database is needed.
+
+    python -m benchmarks.list_serialization --rows 10000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy.engine.result import result_tuple
+
+from app.models import Category, Product
+from app.routes.responses import json_response
+from app.schema.adapters import validate_list, validate_rows
+from app.schema.category import CategoryRead
+from app.schema.pagination import Page
+from app.schema.product import ProductRead
+from app.schema.review import ReviewRead
+
+
+def build_categories(rows: int) -> list[Category]:
+    now = datetime.now(timezone.utc)
+    return [
+        Category(
+            id=uuid.uuid4(),
+            name=f"Category {index}",
+            description="Benchmark category",
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(rows)
+    ]
+
+
+def build_products(rows: int) -> list[Product]:
+    now = datetime.now(timezone.utc)
+    category = build_categories(1)[0]
+    return [
+        Product(
+            id=uuid.uuid4(),
+            name=f"Product {index}",
+            description="Benchmark product",
+            stock=index % 50,
+            price=9.99 + index,
+            is_active=True,
+            category=category,
+            category_id=category.id,
+            rating_count=3,
+            rating_sum=12.0,
+            rating_star_1=0,
+            rating_star_2=0,
+            rating_star_3=1,
+            rating_star_4=1,
+            rating_star_5=1,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(rows)
+    ]
+
+
+def build_reviews(rows: int) -> list:
+    now = datetime.now(timezone.utc)
+    make_row = result_tuple(list(ReviewRead.model_fields))
+    product_id, user_id = uuid.uuid4(), uuid.uuid4()
+    return [
+        make_row((uuid.uuid4(), product_id, user_id, 4.5, "Great", now, now))
+        for _ in range(rows)
+    ]
+
+
+async def response_model_path(model, rows, paged: bool) -> bytes:
+    items = [model.model_validate(row, from_attributes=True) for row in rows]
+    content = Page[model](items=items) if paged else items
+    field = create_model_field(
+        name="Response", type_=Page[model] if paged else list[model]
+    )
+    payload = await serialize_response(field=field, response_content=content)
+    return JSONResponse(payload).body
+
+
+async def json_response_path(model, rows, paged: bool) -> bytes:
+    if model is ReviewRead:
+        items = validate_rows(model, rows)
+    else:
+        items = validate_list(model, rows)
+    if paged:
+        return json_response(Page[model](items=items)).body
+    return json_response(items, list[model]).body
+
+
+async def measure(path, model, rows, paged: bool, repeat: int) -> float:
+    await path(model, rows, paged)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await path(model, rows, paged)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def main(rows: int, repeat: int) -> None:
+    cases = [
+        ("products", ProductRead, build_products(rows), True),
+        ("categories", CategoryRead, build_categories(rows), False),
+        ("reviews", ReviewRead, build_reviews(rows), True),
+    ]
+    print(f"{'':12}{'response_model':>16}{'json_response':>16}{'speedup':>10}")
+    for name, model, data, paged in cases:
+        old_body = await response_model_path(model, data, paged)
+        new_body = await json_response_path(model, data, paged)
+        assert json.loads(old_body) == json.loads(new_body), name
+        old = await measure(response_model_path, model, data, paged, repeat)
+        new = await measure(json_response_path, model, data, paged, repeat)
+        print(f"{name:12}{old * 1000:>14.1f}ms{new * 1000:>14.1f}ms{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
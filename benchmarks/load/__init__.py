@@ -0,0 +1,8 @@
+"""HTTP load benchmarks for the v1 routers.
+
+Seeds a deterministic dataset into DATABASE_URL, drives scripted user scenarios
+against ``app.main:app`` and reports RPS and latency percentiles per endpoint.
+
+    python -m benchmarks.load --products 10000 --output before.json
+    python -m benchmarks.load.compare before.json after.json --threshold 0.1
+"""
@@ -0,0 +1,220 @@
+"""Run the HTTP load scenarios and write a JSON report.
+
+By default the app runs in-process behind httpx's ASGITransport. ``--mode
+uvicorn`` starts real uvicorn workers and sends requests over TCP instead.
+Request logging is sampled off unless LOG_SAMPLE_RATE is set, so the console
+does not become the bottleneck.
+
+    python -m benchmarks.load --products 10000 --iterations 200 --output run.json
+    python -m benchmarks.load --mode uvicorn --workers 4 --scenarios login
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import httpx
+
+from benchmarks.load.dataset import seed
+from benchmarks.load.scenarios import SCENARIOS
+from benchmarks.load.stats import Recorder
+
+os.environ.setdefault("LOG_SAMPLE_RATE", "0")
+
+
+@asynccontextmanager
+async def asgi_client():
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadbench"
+        ) as client:
+            yield client
+
+
+@asynccontextmanager
+async def uvicorn_client(port: int, workers: int):
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "app",
+            "serve",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+        ]
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+            deadline = time.monotonic() + 30
+            while True:
+                if server.poll() is not None:
+                    raise RuntimeError("uvicorn exited before it was ready")
+                try:
+                    await client.get("/")
+                    break
+                except httpx.TransportError:
+                    if time.monotonic() > deadline:
+                        raise
+                    await asyncio.sleep(0.2)
+            yield client
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+async def run_scenario(
+    client, dataset, name: str, iterations: int, warmup: int, concurrency: int, seed
+) -> dict:
+    scenario = SCENARIOS[name]
+    recorder = Recorder(client)
+
+    async def worker(indexes) -> None:
+        for index in indexes:
+            rng = random.Random(f"{seed}-{name}-{index}")
+            await scenario(recorder, dataset, rng)
+
+    async def run(start: int, count: int) -> float:
+        indexes = iter(range(start, start + count))
+        begin = time.perf_counter()
+        await asyncio.gather(*(worker(indexes) for _ in range(concurrency)))
+        return time.perf_counter() - begin
+
+    recorder.recording = False
+    await run(-warmup, warmup)
+    recorder.recording = True
+    elapsed = await run(0, iterations)
+
+    return {
+        "iterations": iterations,
+        "elapsed_s": round(elapsed, 3),
+        "iterations_per_s": round(iterations / elapsed, 1),
+        "endpoints": recorder.summary(elapsed),
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results: dict) -> None:
+    header = f"{'endpoint':44}{'count':>7}{'err':>5}{'rps':>9}"
+    header += f"{'p50':>9}{'p95':>9}{'p99':>9}"
+    for name, scenario in results.items():
+        print(f"\n{name}: {scenario['iterations_per_s']} iterations/s")
+        print(header)
+        for endpoint, stats in scenario["endpoints"].items():
+            print(
+                f"{endpoint:44}{stats['count']:>7}{stats['errors']:>5}"
+                f"{stats['rps']:>9.1f}{stats['p50_ms']:>7.1f}ms"
+                f"{stats['p95_ms']:>7.1f}ms{stats['p99_ms']:>7.1f}ms"
+            )
+
+
+async def main(args: argparse.Namespace) -> dict:
+    from app.db.session import DATABASE_URL, create_engine
+
+    engine = create_engine(DATABASE_URL)
+    try:
+        dataset = await seed(
+            engine,
+            categories=args.categories,
+            products=args.products,
+            users=args.users,
+            reviewed_products=args.reviewed_products,
+            reviews_per_product=args.reviews_per_product,
+        )
+    finally:
+        await engine.dispose()
+
+    if args.mode == "uvicorn":
+        client_context = uvicorn_client(args.port, args.workers)
+    else:
+        client_context = asgi_client()
+
+    results = {}
+    async with client_context as client:
+        for name in args.scenarios:
+            results[name] = await run_scenario(
+                client,
+                dataset,
+                name,
+                args.iterations,
+                args.warmup,
+                args.concurrency,
+                args.seed,
+            )
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "mode": args.mode,
+            "workers": args.workers if args.mode == "uvicorn" else None,
+            "concurrency": args.concurrency,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "dataset": {
+                "categories": args.categories,
+                "products": args.products,
+                "users": args.users,
+                "reviewed_products": dataset.reviewed_products,
+                "reviews_per_product": args.reviews_per_product,
+            },
+        },
+        "scenarios": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS)
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--reviewed-products", type=int, default=500)
+    parser.add_argument("--reviews-per-product", type=int, default=20)
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = asyncio.run(main(args))
+    print_report(report["scenarios"])
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+        print(f"\nwrote {args.output}")
@@ -0,0 +1,91 @@
+"""Compare two load benchmark reports and fail on regressions.
+
+An endpoint regresses when its latency at the chosen percentile grows by more
+than the threshold, or when it returns errors the baseline did not. Endpoints
+present in only one report are listed but never fail the comparison.
+
+    python -m benchmarks.load.compare before.json after.json --threshold 0.1
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class Comparison:
+    scenario: str
+    endpoint: str
+    baseline: Optional[float]
+    current: Optional[float]
+    regressed: bool = False
+
+    @property
+    def change(self) -> Optional[float]:
+        if not self.baseline or self.current is None:
+            return None
+        return (self.current - self.baseline) / self.baseline
+
+
+def endpoint_stats(report: dict) -> dict[tuple[str, str], dict]:
+    return {
+        (scenario_name, endpoint): stats
+        for scenario_name, scenario in report["scenarios"].items()
+        for endpoint, stats in scenario["endpoints"].items()
+    }
+
+
+def compare(
+    baseline: dict, current: dict, metric: str = "p95_ms", threshold: float = 0.1
+) -> list[Comparison]:
+    before, after = endpoint_stats(baseline), endpoint_stats(current)
+    comparisons = []
+    for key in sorted(before.keys() | after.keys()):
+        old, new = before.get(key), after.get(key)
+        comparison = Comparison(
+            *key,
+            baseline=old[metric] if old else None,
+            current=new[metric] if new else None,
+        )
+        if old and new:
+            change = comparison.change
+            comparison.regressed = (change is not None and change > threshold) or (
+                new["errors"] > 0 and old["errors"] == 0
+            )
+        comparisons.append(comparison)
+    return comparisons
+
+
+def _format(value: Optional[float], suffix: str = "ms") -> str:
+    return "-" if value is None else f"{value:.1f}{suffix}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--metric", default="p95_ms")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    with open(args.baseline) as baseline, open(args.current) as current:
+        comparisons = compare(
+            json.load(baseline), json.load(current), args.metric, args.threshold
+        )
+
+    print(f"{'scenario':16}{'endpoint':44}{'baseline':>10}{'current':>10}{'change':>9}")
+    for comparison in comparisons:
+        change = comparison.change
+        print(
+            f"{comparison.scenario:16}{comparison.endpoint:44}"
+            f"{_format(comparison.baseline):>10}{_format(comparison.current):>10}"
+            f"{'-' if change is None else f'{change:+.0%}':>9}"
+            f"{'  REGRESSION' if comparison.regressed else ''}"
+        )
+
+    regressions = sum(comparison.regressed for comparison in comparisons)
+    if regressions:
+        print(f"\n{regressions} endpoint(s) regressed beyond {args.threshold:.0%}")
+        sys.exit(1)
@@ -0,0 +1,145 @@
+import hashlib
+import uuid
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.commands.backfill_ratings import backfill_rating_aggregates
+from app.models.value_objects import Password
+
+PASSWORD = "Loadbench#1"
+WORDS = ["Lamp", "Chair", "Table", "Kettle", "Jacket", "Boots", "Novel", "Kite"]
+
+
+def stable_id(kind: str, index: int) -> uuid.UUID:
+    # Matches md5('loadbench-<kind>-<index>')::uuid on the database side.
+    return uuid.UUID(hashlib.md5(f"loadbench-{kind}-{index}".encode()).hexdigest())
+
+
+def _sql_id(kind: str, index: str = "i") -> str:
+    return f"md5('loadbench-{kind}-' || {index})::uuid"
+
+
+@dataclass(frozen=True)
+class User:
+    email: str
+    id: uuid.UUID
+    cart_id: uuid.UUID
+
+
+@dataclass(frozen=True)
+class Dataset:
+    categories: int
+    products: int
+    users: int
+    reviewed_products: int
+
+    def category_id(self, index: int) -> uuid.UUID:
+        return stable_id("category", index % self.categories)
+
+    def product_id(self, index: int) -> uuid.UUID:
+        return stable_id("product", index % self.products)
+
+    def reviewed_product_id(self, index: int) -> uuid.UUID:
+        return stable_id("product", index % self.reviewed_products)
+
+    def user(self, index: int) -> User:
+        index %= self.users
+        return User(
+            email=f"loadbench-{index}@example.com",
+            id=stable_id("user", index),
+            cart_id=stable_id("cart", index),
+        )
+
+
+async def seed(
+    engine: AsyncEngine,
+    categories: int,
+    products: int,
+    users: int,
+    reviewed_products: int,
+    reviews_per_product: int,
+) -> Dataset:
+    """Insert the dataset if missing and empty the benchmark carts.
+
+    Rows get stable ids, so seeding again with the same sizes is a no-op and
+    every run starts from the same state.
+    """
+    reviewed_products = min(reviewed_products, products)
+    reviews_per_product = min(reviews_per_product, users)
+    hashed_password = Password(raw=PASSWORD).hash()
+    review_id = _sql_id("review", "p || '-' || k")
+    words = "ARRAY[" + ", ".join(f"'{word}'" for word in WORDS) + "]"
+
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO categories (id, name, description, created_at, "
+                f"updated_at) SELECT {_sql_id('category')}, "
+                "'Loadbench category ' || i, 'Benchmark category', now(), now() "
+                "FROM generate_series(0, :count - 1) AS i ON CONFLICT DO NOTHING"
+            ),
+            {"count": categories},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO products (id, name, description, stock, price, "
+                "is_active, created_at, updated_at, category_id) SELECT "
+                f"{_sql_id('product')}, ({words})[1 + i % {len(WORDS)}] || ' ' || "
+                f"({words})[1 + i / {len(WORDS)} % {len(WORDS)}] || ' ' || i, "
+                "'Benchmark product', 1000000, 1 + (i * 37) % 500, true, "
+                "now() - i * interval '1 second', now(), "
+                f"{_sql_id('category', 'i % :categories')} "
+                "FROM generate_series(0, :count - 1) AS i ON CONFLICT DO NOTHING"
+            ),
+            {"count": products, "categories": categories},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO users (id, email, full_name, hashed_password, "
+                f"is_active, is_superuser, created_at, updated_at) SELECT "
+                f"{_sql_id('user')}, 'loadbench-' || i || '@example.com', "
+                "'Load Bench', :password, true, false, now(), now() "
+                "FROM generate_series(0, :count - 1) AS i ON CONFLICT DO NOTHING"
+            ),
+            {"count": users, "password": hashed_password},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO carts (id, user_id, created_at, updated_at, is_active, "
+                f"is_checked_out) SELECT {_sql_id('cart')}, {_sql_id('user')}, "
+                "now(), now(), true, false "
+                "FROM generate_series(0, :count - 1) AS i ON CONFLICT DO NOTHING"
+            ),
+            {"count": users},
+        )
+        reviews = await conn.execute(
+            text(
+                "INSERT INTO reviews (id, product_id, user_id, rating, comment, "
+                "created_at, updated_at) SELECT "
+                f"{review_id}, {_sql_id('product', 'p')}, "
+                f"{_sql_id('user', '(p + k) % :users')}, 1 + (p + k) % 5, "
+                "'Benchmark review', now() - k * interval '1 minute', now() "
+                "FROM generate_series(0, :products - 1) AS p, "
+                "generate_series(0, :per_product - 1) AS k ON CONFLICT DO NOTHING"
+            ),
+            {
+                "products": reviewed_products,
+                "per_product": reviews_per_product,
+                "users": users,
+            },
+        )
+        await conn.execute(
+            text(
+                "DELETE FROM cart_items WHERE cart_id IN (SELECT "
+                f"{_sql_id('cart')} FROM generate_series(0, :count - 1) AS i)"
+            ),
+            {"count": users},
+        )
+
+    if reviews.rowcount:
+        async with AsyncSession(engine) as db:
+            await backfill_rating_aggregates(db)
+
+    return Dataset(categories, products, users, reviewed_products)
@@ -0,0 +1,83 @@
+import random
+
+from benchmarks.load.dataset import PASSWORD, WORDS, Dataset
+from benchmarks.load.stats import Recorder
+
+
+async def browse_catalog(recorder: Recorder, dataset: Dataset, rng: random.Random):
+    await recorder.get("/category/")
+    page = await recorder.get("/product/", params={"limit": 20})
+    cursor = page.json().get("next_cursor")
+    if cursor:
+        await recorder.get("/product/", params={"limit": 20, "cursor": cursor})
+
+    category_id = str(dataset.category_id(rng.randrange(dataset.categories)))
+    await recorder.get(
+        "/product/",
+        params={"category_id": category_id, "sort": "price", "limit": 20},
+    )
+    await recorder.get("/product/facets", params={"category_id": category_id})
+    await recorder.get("/product/search", params={"q": rng.choice(WORDS)})
+
+
+async def product_detail(recorder: Recorder, dataset: Dataset, rng: random.Random):
+    path_params = {"product_id": dataset.product_id(rng.randrange(dataset.products))}
+    response = await recorder.get("/product/{product_id}", path_params)
+    etag = response.headers.get("ETag")
+    if etag:
+        await recorder.get(
+            "/product/{product_id}", path_params, headers={"If-None-Match": etag}
+        )
+
+
+async def add_to_cart(recorder: Recorder, dataset: Dataset, rng: random.Random):
+    user = dataset.user(rng.randrange(dataset.users))
+    product_id = dataset.product_id(rng.randrange(dataset.products))
+    product = await recorder.get("/product/{product_id}", {"product_id": product_id})
+    await recorder.post(
+        "/cart/{cart_id}/items",
+        {"cart_id": user.cart_id},
+        json={
+            "cart_id": str(user.cart_id),
+            "product_id": str(product_id),
+            "quantity": rng.randint(1, 3),
+            "price_snapshot": product.json()["price"],
+        },
+    )
+    await recorder.get("/cart/{user_id}", {"user_id": user.id})
+
+
+async def login(recorder: Recorder, dataset: Dataset, rng: random.Random):
+    user = dataset.user(rng.randrange(dataset.users))
+    await recorder.post(
+        "/auth/login", data={"username": user.email, "password": PASSWORD}
+    )
+
+
+async def review_listing(recorder: Recorder, dataset: Dataset, rng: random.Random):
+    path_params = {
+        "product_id": dataset.reviewed_product_id(
+            rng.randrange(dataset.reviewed_products)
+        )
+    }
+    page = await recorder.get("/review/{product_id}", path_params, params={"limit": 10})
+    cursor = page.json().get("next_cursor")
+    if cursor:
+        await recorder.get(
+            "/review/{product_id}",
+            path_params,
+            params={"limit": 10, "cursor": cursor},
+        )
+    await recorder.get(
+        "/review/{product_id}", path_params, params={"limit": 10, "sort": "rating"}
+    )
+    await recorder.get("/review/", params={"limit": 20})
+
+
+SCENARIOS = {
+    "browse_catalog": browse_catalog,
+    "product_detail": product_detail,
+    "add_to_cart": add_to_cart,
+    "login": login,
+    "review_listing": review_listing,
+}
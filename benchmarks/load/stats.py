@@ -0,0 +1,73 @@
+import math
+import statistics
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+import httpx
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+@dataclass
+class EndpointSamples:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed: float) -> dict:
+        count = len(self.latencies)
+        summary = {
+            "count": count,
+            "errors": self.errors,
+            "rps": round(count / elapsed, 1) if elapsed else 0.0,
+            "mean_ms": (
+                round(statistics.fmean(self.latencies) * 1000, 3) if count else 0.0
+            ),
+        }
+        for pct in PERCENTILES:
+            value = percentile(self.latencies, pct) * 1000
+            summary[f"p{pct}_ms"] = round(value, 3)
+        return summary
+
+
+class Recorder:
+    """Times requests, grouped by route template such as ``GET /cart/{user_id}``."""
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self.client = client
+        self.samples: defaultdict[str, EndpointSamples] = defaultdict(EndpointSamples)
+        self.recording = True
+
+    async def request(
+        self, method: str, template: str, path_params: dict | None = None, **kwargs
+    ) -> httpx.Response:
+        url = template.format(**(path_params or {}))
+        start = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        duration = time.perf_counter() - start
+        if self.recording:
+            samples = self.samples[f"{method} {template}"]
+            samples.latencies.append(duration)
+            if response.status_code >= 400:
+                samples.errors += 1
+        return response
+
+    async def get(self, template: str, path_params: dict | None = None, **kwargs):
+        return await self.request("GET", template, path_params, **kwargs)
+
+    async def post(self, template: str, path_params: dict | None = None, **kwargs):
+        return await self.request("POST", template, path_params, **kwargs)
+
+    def summary(self, elapsed: float) -> dict:
+        return {
+            endpoint: samples.summary(elapsed)
+            for endpoint, samples in sorted(self.samples.items())
+        }
@@ -0,0 +1,83 @@
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+from app.cache import InMemoryCache
+from app.schema.category import CategoryRead
+from app.schema.product import ProductRead
+from app.services.product import ProductService, product_cache_key
+
+
+def test_in_memory_cache_counts_hits_and_misses():
+    cache = InMemoryCache()
+
+    async def scenario():
+        assert await cache.get("missing") is None
+        await cache.set("key", b"value", ttl=60)
+        assert await cache.get("key") == b"value"
+
+    asyncio.run(scenario())
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_in_memory_cache_expires_entries():
+    cache = InMemoryCache()
+
+    async def scenario():
+        await cache.set("key", b"value", ttl=0)
+        return await cache.get("key")
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_in_memory_cache_delete():
+    cache = InMemoryCache()
+
+    async def scenario():
+        await cache.set("key", b"value", ttl=60)
+        await cache.delete("key")
+        return await cache.get("key")
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_in_memory_cache_evicts_oldest_entry_when_full():
+    cache = InMemoryCache(max_entries=2)
+
+    async def scenario():
+        await cache.set("a", b"1", ttl=60)
+        await cache.set("b", b"2", ttl=60)
+        await cache.set("c", b"3", ttl=60)
+        return [await cache.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(scenario()) == [None, b"2", b"3"]
+
+
+def test_product_service_serves_cached_product_without_database():
+    now = datetime.now(timezone.utc)
+    product = ProductRead(
+        id=uuid.uuid4(),
+        name="Laptop",
+        description="Gaming laptop",
+        stock=5,
+        price=2000.00,
+        is_active=True,
+        category=CategoryRead(
+            id=uuid.uuid4(), name="Electronics", created_at=now, updated_at=now
+        ),
+        created_at=now,
+        updated_at=now,
+    )
+    cache = InMemoryCache()
+    service = ProductService(db=None, cache=cache)
+
+    async def scenario():
+        await cache.set(
+            product_cache_key(product.id), product.model_dump_json().encode(), ttl=60
+        )
+        return await service.get_product_by_id(product.id)
+
+    assert asyncio.run(scenario()) == product
+    assert cache.stats.hits == 1
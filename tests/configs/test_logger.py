@@ -0,0 +1,30 @@
+import asyncio
+
+from app.configs import logger as logger_module
+from app.configs.logger import add_file_sink, logger, remove_file_sink
+
+
+def test_file_sink_is_added_once_per_process_and_flushed_on_removal(
+    tmp_path, monkeypatch
+):
+    log_file = tmp_path / "app.log"
+    monkeypatch.setattr(logger_module, "LOG_FILE", str(log_file))
+
+    add_file_sink()
+    sink = logger_module._file_sink
+    add_file_sink()
+    assert logger_module._file_sink == sink
+
+    logger.info("written from the worker")
+    asyncio.run(remove_file_sink())
+
+    assert logger_module._file_sink is None
+    assert "written from the worker" in log_file.read_text()
+
+
+def test_file_sink_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(logger_module, "LOG_FILE", "")
+
+    add_file_sink()
+
+    assert logger_module._file_sink is None
@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from app.configs.logger import logger
+from app.configs.logging_middleware import LoggingMiddleware
+
+
+def _build_app(**options):
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, **options)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        if item_id == 0:
+            raise HTTPException(status_code=404)
+        if item_id < 0:
+            raise RuntimeError("boom")
+        return {"id": item_id}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    return app
+
+
+@pytest.fixture()
+def records():
+    captured = []
+    sink = logger.add(lambda message: captured.append(message.record["extra"]))
+    yield captured
+    logger.remove(sink)
+
+
+def _get(app, path):
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("10.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+    return messages[0]["status"]
+
+
+def test_logs_route_template_and_request_fields(records):
+    app = _build_app()
+
+    assert _get(app, "/items/42") == 200
+
+    (record,) = records
+    assert record["method"] == "GET"
+    assert record["path"] == "/items/{item_id}"
+    assert record["status_code"] == 200
+    assert record["client_ip"] == "10.0.0.1"
+    assert record["duration"] >= 0
+
+
+def test_sampling_skips_successes_but_keeps_errors(records):
+    app = _build_app(sample_rate=0.0)
+
+    _get(app, "/items/1")
+    _get(app, "/items/0")
+    with pytest.raises(RuntimeError):
+        _get(app, "/items/-1")
+
+    assert [record["status_code"] for record in records] == [404, 500]
+
+
+def test_excluded_paths_still_log_slow_requests(records):
+    _get(_build_app(exclude_paths=frozenset({"/health"})), "/health")
+    assert records == []
+
+    _get(_build_app(exclude_paths=frozenset({"/health"}), slow_request_ms=0), "/health")
+    assert [record["path"] for record in records] == ["/health"]
@@ -0,0 +1,118 @@
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.configs.logger import logger
+from app.configs.query_budget_middleware import QueryBudgetMiddleware
+from app.db.query_counter import (
+    QueryBudgetExceeded,
+    assert_max_queries,
+    count_queries,
+    query_budget,
+)
+
+
+async def _select_one(engine, times: int) -> None:
+    async with engine.connect() as connection:
+        for _ in range(times):
+            await connection.execute(text("SELECT 1"))
+
+
+def _build_app(engine, **options):
+    @asynccontextmanager
+    async def lifespan(app):
+        yield
+        # TestClient runs the app on its own loop; close its connections there.
+        await engine.dispose()
+
+    app = FastAPI(lifespan=lifespan)
+    app.add_middleware(QueryBudgetMiddleware, **options)
+
+    @app.get("/queries/{times}")
+    @query_budget(2)
+    async def run_queries(times: int):
+        await _select_one(engine, times)
+        return {"ran": times}
+
+    return app
+
+
+@pytest.fixture()
+def records():
+    captured = []
+    sink = logger.add(
+        lambda message: captured.append(message.record["message"]), level="WARNING"
+    )
+    yield captured
+    logger.remove(sink)
+
+
+def test_count_queries_counts_statements_in_nested_scopes(async_engine, run_async):
+    async def scenario():
+        with count_queries() as outer:
+            await _select_one(async_engine, 1)
+            with count_queries() as inner:
+                await _select_one(async_engine, 2)
+        return outer, inner
+
+    outer, inner = run_async(scenario())
+
+    assert inner.count == 2
+    assert outer.count == 3
+    assert outer.statements["SELECT 1"] == 3
+
+
+def test_assert_max_queries_raises_when_budget_is_exceeded(async_engine, run_async):
+    with pytest.raises(QueryBudgetExceeded, match="at most 1 queries, ran 2"):
+        with assert_max_queries(1):
+            run_async(_select_one(async_engine, 2))
+
+
+def test_assert_max_queries_decorates_coroutine_functions(async_engine, run_async):
+    @assert_max_queries(1)
+    async def within_budget():
+        await _select_one(async_engine, 1)
+
+    @assert_max_queries(1)
+    async def over_budget():
+        await _select_one(async_engine, 2)
+
+    run_async(within_budget())
+    with pytest.raises(QueryBudgetExceeded, match="at most 1 queries, ran 2"):
+        run_async(over_budget())
+
+
+def test_assert_max_queries_decorates_sync_functions(async_engine, run_async):
+    @assert_max_queries(1)
+    def over_budget():
+        run_async(_select_one(async_engine, 2))
+
+    with pytest.raises(QueryBudgetExceeded):
+        over_budget()
+
+
+def test_middleware_reports_query_count_header_in_debug_mode(async_engine):
+    with TestClient(_build_app(async_engine, debug=True)) as client:
+        response = client.get("/queries/2")
+
+    assert response.headers["X-DB-Queries"] == "2"
+
+
+def test_middleware_logs_budget_and_n_plus_one_warnings(async_engine, records):
+    with TestClient(_build_app(async_engine, n_plus_one_threshold=3)) as client:
+        response = client.get("/queries/3")
+
+    assert response.status_code == 200
+    assert "X-DB-Queries" not in response.headers
+    assert "Possible N+1 query" in records
+    assert "GET /queries/{times} ran 3 queries (budget 2)" in records
+
+
+def test_middleware_raises_in_strict_mode(async_engine):
+    with TestClient(_build_app(async_engine, strict=True)) as client:
+        assert client.get("/queries/2").status_code == 200
+        with pytest.raises(QueryBudgetExceeded):
+            client.get("/queries/3")
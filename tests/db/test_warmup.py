@@ -0,0 +1,45 @@
+import pytest
+from fastapi import FastAPI
+
+from app.schema.adapters import type_adapter
+from app.schema.category import CategoryRead
+from app.schema.pagination import Page
+from app.schema.product import ProductRead
+from app.warmup import fill_pool, warm_serializers
+
+
+def test_fill_pool_opens_pool_size_connections(make_async_engine, run_async):
+    engine = make_async_engine(pool_size=3)
+
+    opened = run_async(fill_pool(engine, ["SELECT 1", "SELECT count(*) FROM users"]))
+
+    assert (opened, engine.pool.checkedin(), engine.pool.checkedout()) == (3, 3, 0)
+
+
+def test_fill_pool_returns_connections_when_a_query_fails(make_async_engine, run_async):
+    engine = make_async_engine(pool_size=2)
+
+    with pytest.raises(Exception, match="missing_table"):
+        run_async(fill_pool(engine, ["SELECT * FROM missing_table"]))
+    assert engine.pool.checkedout() == 0
+
+
+def test_warm_serializers_builds_response_model_adapters():
+    app = FastAPI()
+
+    @app.get("/products", response_model=Page[ProductRead])
+    async def products():
+        pass
+
+    @app.get("/categories", response_model=list[CategoryRead])
+    async def categories():
+        pass
+
+    type_adapter.cache_clear()
+
+    assert warm_serializers(app) == 2
+    cached = type_adapter.cache_info().currsize
+    type_adapter(Page[ProductRead])
+    type_adapter(list[ProductRead])
+    type_adapter(list[CategoryRead])
+    assert type_adapter.cache_info().currsize == cached == 3
@@ -0,0 +1,97 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from app.metrics import MetricsMiddleware, instrument_engine, render_metrics
+from app.metrics.database import statement_operation
+from app.models.value_objects import Password
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_statement_operation_groups_by_leading_keyword():
+    assert statement_operation("  select 1") == "SELECT"
+    assert statement_operation("WITH x AS (SELECT 1) SELECT * FROM x") == "WITH"
+    assert statement_operation("BEGIN") == "OTHER"
+    assert statement_operation("") == "OTHER"
+
+
+def test_middleware_records_route_template_and_in_flight():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    seen_in_flight = []
+
+    @app.get("/metrics-test/{item_id}")
+    async def get_item(item_id: int):
+        seen_in_flight.append(_sample("http_requests_in_progress", method="GET"))
+        return {"id": item_id}
+
+    labels = {"method": "GET", "route": "/metrics-test/{item_id}", "status": "200"}
+    before = _sample("http_request_duration_seconds_count", **labels)
+    baseline = _sample("http_requests_in_progress", method="GET")
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            await c.get("/metrics-test/1")
+            await c.get("/metrics-test/2")
+            await c.get("/metrics-test/missing/path")
+
+    asyncio.run(scenario())
+
+    assert _sample("http_request_duration_seconds_count", **labels) == before + 2
+    assert seen_in_flight == [baseline + 1, baseline + 1]
+    assert _sample("http_requests_in_progress", method="GET") == baseline
+    assert (
+        _sample(
+            "http_request_duration_seconds_count",
+            method="GET",
+            route="<unmatched>",
+            status="404",
+        )
+        >= 1
+    )
+
+
+def test_instrumented_engine_times_queries_and_publishes_pool_gauges(
+    make_async_engine, run_async
+):
+    engine = make_async_engine()
+    instrument_engine(engine, "metrics-test")
+
+    async def scenario():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+            return _sample(
+                "db_pool_connections", engine="metrics-test", state="checked_out"
+            )
+
+    checked_out = run_async(scenario())
+
+    assert checked_out == 1
+    assert (
+        _sample(
+            "db_query_duration_seconds_count", engine="metrics-test", operation="SELECT"
+        )
+        >= 2
+    )
+    assert _sample("db_pool_checkout_wait_seconds_count", engine="metrics-test") >= 1
+
+
+def test_password_hashing_is_timed_and_exported():
+    before = _sample("password_hash_duration_seconds_count", operation="hash")
+
+    Password(raw="Valid1@Password").hash()
+
+    assert _sample("password_hash_duration_seconds_count", operation="hash") == (
+        before + 1
+    )
+    content, media_type = render_metrics()
+    assert media_type.startswith("text/plain")
+    assert b"password_hash_duration_seconds_bucket" in content
@@ -0,0 +1,44 @@
+import asyncio
+
+from app.models.value_objects import Password
+
+RAW_PASSWORD = "Valid1@Password"
+
+
+def test_hash_async_produces_verifiable_hash():
+    password = Password(raw=RAW_PASSWORD)
+
+    hashed = asyncio.run(password.hash_async())
+
+    assert hashed != RAW_PASSWORD
+    assert password.verify(hashed) is True
+
+
+def test_verify_async_matches_sync_verify():
+    hashed = Password(raw=RAW_PASSWORD).hash()
+
+    assert asyncio.run(Password(raw=RAW_PASSWORD).verify_async(hashed)) is True
+    assert asyncio.run(Password(raw="Other1@Password").verify_async(hashed)) is False
+
+
+def test_async_hashing_runs_concurrently_without_blocking_the_loop():
+    password = Password(raw=RAW_PASSWORD)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        task = asyncio.create_task(ticker())
+        hashes = await asyncio.gather(*(password.hash_async() for _ in range(4)))
+        task.cancel()
+        return hashes, ticks
+
+    hashes, ticks = asyncio.run(scenario())
+
+    assert len(set(hashes)) == len(hashes)
+    assert ticks > 1
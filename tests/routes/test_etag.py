@@ -0,0 +1,43 @@
+import uuid
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from app.routes.etag import etag_matches, make_etag, not_modified
+
+
+def _request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+def test_make_etag_is_strong_and_changes_with_version():
+    product_id = uuid.uuid4()
+    first = make_etag("product", product_id, datetime(2026, 1, 1, tzinfo=timezone.utc))
+    second = make_etag("product", product_id, datetime(2026, 1, 2, tzinfo=timezone.utc))
+
+    assert first.startswith('"') and first.endswith('"')
+    assert first != second
+    assert first == make_etag(
+        "product", product_id, datetime(2026, 1, 1, tzinfo=timezone.utc)
+    )
+
+
+def test_etag_matches_handles_lists_weak_tags_and_wildcard():
+    etag = make_etag("categories", 3)
+
+    assert not etag_matches(_request(), etag)
+    assert not etag_matches(_request('"other"'), etag)
+    assert etag_matches(_request(f'"other", {etag}'), etag)
+    assert etag_matches(_request(f"W/{etag}"), etag)
+    assert etag_matches(_request("*"), etag)
+
+
+def test_not_modified_has_no_body():
+    response = not_modified('"abc"')
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"abc"'
+    assert response.body == b""
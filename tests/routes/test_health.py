@@ -0,0 +1,24 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routes import health
+
+
+def _build_app():
+    app = FastAPI()
+    app.include_router(health.router)
+    return app
+
+
+def test_liveness_reports_ok():
+    client = TestClient(_build_app())
+
+    assert client.get("/health").json() == {"status": "ok"}
+
+
+def test_readiness_answers_once_the_app_is_serving():
+    client = TestClient(_build_app())
+
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
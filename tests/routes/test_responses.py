@@ -0,0 +1,58 @@
+import json
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy.engine.result import result_tuple
+
+from app.routes.responses import json_response
+from app.schema.adapters import type_adapter, validate_list, validate_rows
+from app.schema.category import CategoryRead
+from app.schema.pagination import Page
+from app.schema.review import ReviewRead
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _category(name):
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        name=name,
+        description=None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def test_type_adapter_is_cached_per_type():
+    assert type_adapter(list[CategoryRead]) is type_adapter(list[CategoryRead])
+
+
+def test_validate_list_reads_attributes():
+    categories = validate_list(CategoryRead, [_category("Books"), _category("Toys")])
+
+    assert [category.name for category in categories] == ["Books", "Toys"]
+
+
+def test_validate_rows_reads_result_rows():
+    make_row = result_tuple(list(ReviewRead.model_fields))
+    review_id, product_id, user_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    (review,) = validate_rows(
+        ReviewRead, [make_row((review_id, product_id, user_id, 4.0, None, NOW, NOW))]
+    )
+
+    assert review.id == review_id
+    assert review.rating == 4.0
+
+
+def test_json_response_serializes_models_to_bytes():
+    categories = validate_list(CategoryRead, [_category("Books")])
+
+    listed = json_response(categories, list[CategoryRead], headers={"ETag": '"x"'})
+    paged = json_response(Page[CategoryRead](items=categories, next_cursor="abc"))
+
+    assert listed.media_type == "application/json"
+    assert listed.headers["etag"] == '"x"'
+    assert json.loads(listed.body)[0]["name"] == "Books"
+    assert json.loads(paged.body)["next_cursor"] == "abc"
@@ -5,7 +5,9 @@ from decimal import Decimal
 import pytest
 
 from app.schema.cart_item import (
+    CartItemBatch,
     CartItemCreate,
+    CartItemOperation,
     CartItemRead,
     CartItemUpdate,
 )
@@ -87,3 +89,16 @@ def test_cart_item_read_valid():
     assert isinstance(item.created_at, datetime)
     assert item.quantity == 3
     assert item.price_snapshot == Decimal("39.99")
+
+
+def test_cart_item_operation_requires_quantity_unless_removing():
+    product_id = uuid.uuid4()
+
+    assert CartItemOperation(action="remove", product_id=product_id).quantity is None
+    with pytest.raises(ValueError):
+        CartItemOperation(action="set", product_id=product_id)
+
+
+def test_cart_item_batch_rejects_empty_operations():
+    with pytest.raises(ValueError):
+        CartItemBatch(operations=[])
@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.schema.pagination import Page, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime.now(timezone.utc)
+    product_id = uuid.uuid4()
+
+    cursor = encode_cursor(created_at, product_id)
+    values = decode_cursor(cursor, 2)
+
+    assert datetime.fromisoformat(values[0]) == created_at
+    assert uuid.UUID(values[1]) == product_id
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+    assert "=" not in cursor
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "!!!"])
+def test_decode_invalid_cursor_raises(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, 2)
+
+
+def test_decode_cursor_with_wrong_size_raises():
+    cursor = encode_cursor(datetime.now(timezone.utc))
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor, 2)
+
+
+def test_page_defaults_to_no_next_cursor():
+    page = Page[int](items=[1, 2, 3])
+    assert page.items == [1, 2, 3]
+    assert page.next_cursor is None
@@ -0,0 +1,57 @@
+import time
+
+from app.security.token_cache import TokenCache
+
+FUTURE_EXP = time.time() + 3600
+
+
+def test_should_return_cached_payload_for_same_token():
+    cache = TokenCache(maxsize=10)
+    cache.set("token", {"sub": "user", "exp": FUTURE_EXP})
+
+    assert cache.get("token") == {"sub": "user", "exp": FUTURE_EXP}
+    assert cache.stats.hits == 1
+
+
+def test_should_miss_for_unknown_token():
+    cache = TokenCache(maxsize=10)
+
+    assert cache.get("unknown") is None
+    assert cache.stats.misses == 1
+
+
+def test_should_evict_entry_once_token_expires():
+    cache = TokenCache(maxsize=10)
+    cache.set("token", {"sub": "user", "exp": time.time() - 1})
+
+    assert cache.get("token") is None
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+
+
+def test_should_evict_least_recently_used_token_when_full():
+    cache = TokenCache(maxsize=2)
+    cache.set("a", {"sub": "a", "exp": FUTURE_EXP})
+    cache.set("b", {"sub": "b", "exp": FUTURE_EXP})
+    cache.get("a")
+    cache.set("c", {"sub": "c", "exp": FUTURE_EXP})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_should_not_cache_tokens_without_expiration():
+    cache = TokenCache(maxsize=10)
+    cache.set("token", {"sub": "user"})
+
+    assert cache.get("token") is None
+
+
+def test_should_key_entries_by_digest_instead_of_raw_token():
+    cache = TokenCache(maxsize=10)
+    cache.set("secret-token", {"sub": "user", "exp": FUTURE_EXP})
+
+    assert "secret-token" not in cache._entries
+    assert TokenCache.digest("secret-token") in cache._entries
@@ -0,0 +1,138 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.schema.cart_item import CartItemBatch, CartItemCreate, CartItemOperation
+from app.services.cart_item import CartItemService, fold_operations
+
+
+@pytest.fixture()
+def cart(session):
+    ids = {name: uuid.uuid4() for name in ("user", "category", "product", "cart")}
+    session.execute(text("TRUNCATE TABLE categories CASCADE"))
+    session.execute(
+        text(
+            "INSERT INTO users (id, email, full_name, hashed_password, is_active, "
+            "is_superuser, created_at, updated_at) "
+            "VALUES (:user, 'cart@example.com', 'Cart Owner', 'x', true, false, "
+            "now(), now());"
+            "INSERT INTO categories (id, name, description, created_at, updated_at) "
+            "VALUES (:category, 'Books', 'All books', now(), now());"
+            "INSERT INTO products (id, name, description, stock, price, is_active, "
+            "created_at, updated_at, category_id) "
+            "VALUES (:product, 'Book', 'A book', 10, 12.5, true, now(), now(), "
+            ":category);"
+            "INSERT INTO carts (id, user_id, created_at, updated_at, is_active, "
+            "is_checked_out) VALUES (:cart, :user, now(), now(), true, false)"
+        ),
+        ids,
+    )
+    session.commit()
+    return ids
+
+
+def _add(run_db, cart_id, product_id, quantity):
+    return run_db(
+        lambda db: CartItemService(db).create_cart_item(
+            CartItemCreate(
+                cart_id=cart_id,
+                product_id=product_id,
+                quantity=quantity,
+                price_snapshot=Decimal("12.50"),
+            )
+        )
+    )
+
+
+def test_create_cart_item_merges_quantity_for_same_product(cart, run_db):
+    first = _add(run_db, cart["cart"], cart["product"], 2)
+    second = _add(run_db, cart["cart"], cart["product"], 3)
+
+    assert second.id == first.id
+    assert second.quantity == 5
+    assert second.user_id == cart["user"]
+    assert second.product.id == cart["product"]
+    assert second.product.category.name == "Books"
+
+
+def test_create_cart_item_missing_cart_returns_404(cart, run_db):
+    with pytest.raises(HTTPException) as exc_info:
+        _add(run_db, uuid.uuid4(), cart["product"], 1)
+
+    assert exc_info.value.detail == "Cart not found"
+
+
+def test_create_cart_item_missing_product_returns_404(cart, run_db):
+    with pytest.raises(HTTPException) as exc_info:
+        _add(run_db, cart["cart"], uuid.uuid4(), 1)
+
+    assert exc_info.value.detail == "Product not found"
+
+
+def test_fold_operations_applies_actions_in_order():
+    first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    operations = [
+        CartItemOperation(action="add", product_id=first, quantity=1),
+        CartItemOperation(action="add", product_id=first, quantity=2),
+        CartItemOperation(action="set", product_id=second, quantity=4),
+        CartItemOperation(action="add", product_id=second, quantity=1),
+        CartItemOperation(action="add", product_id=third, quantity=1),
+        CartItemOperation(action="remove", product_id=third),
+    ]
+
+    increments, quantities, removals = fold_operations(operations)
+
+    assert increments == {first: 3}
+    assert quantities == {second: 5}
+    assert removals == {third}
+
+
+def _apply(run_db, cart_id, operations):
+    return run_db(
+        lambda db: CartItemService(db).apply_batch(
+            cart_id, CartItemBatch(operations=operations)
+        )
+    )
+
+
+def test_apply_batch_adds_sets_and_removes_in_one_request(cart, run_db):
+    _add(run_db, cart["cart"], cart["product"], 2)
+
+    updated = _apply(
+        run_db,
+        cart["cart"],
+        [
+            CartItemOperation(action="add", product_id=cart["product"], quantity=1),
+        ],
+    )
+    assert [(item.product.id, item.quantity) for item in updated.items] == [
+        (cart["product"], 3)
+    ]
+    assert updated.items[0].price_snapshot == Decimal("12.50")
+
+    emptied = _apply(
+        run_db,
+        cart["cart"],
+        [CartItemOperation(action="remove", product_id=cart["product"])],
+    )
+    assert emptied.items == []
+
+
+def test_apply_batch_with_unknown_product_changes_nothing(cart, run_db):
+    _add(run_db, cart["cart"], cart["product"], 2)
+
+    with pytest.raises(HTTPException) as exc_info:
+        _apply(
+            run_db,
+            cart["cart"],
+            [
+                CartItemOperation(action="remove", product_id=cart["product"]),
+                CartItemOperation(action="add", product_id=uuid.uuid4(), quantity=1),
+            ],
+        )
+
+    assert exc_info.value.status_code == 404
+    assert _add(run_db, cart["cart"], cart["product"], 1).quantity == 3
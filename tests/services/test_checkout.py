@@ -0,0 +1,109 @@
+import uuid
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.schema.checkout import CheckoutCreate
+from app.services.checkout import CheckoutService
+
+
+@pytest.fixture()
+def cart(session):
+    ids = {
+        name: uuid.uuid4()
+        for name in ("user", "address", "category", "book", "pen", "cart")
+    }
+    session.execute(text("TRUNCATE TABLE categories CASCADE"))
+    session.execute(
+        text(
+            "INSERT INTO users (id, email, full_name, hashed_password, is_active, "
+            "is_superuser, created_at, updated_at) "
+            "VALUES (:user, 'buyer@example.com', 'Buyer', 'x', true, false, "
+            "now(), now());"
+            "INSERT INTO addresses (id, user_id, street, city, state, country, "
+            "postal_code, is_default_shipping, is_default_billing, created_at, "
+            "updated_at) VALUES (:address, :user, 'Street', 'City', 'State', "
+            "'Country', '00000', true, true, now(), now());"
+            "INSERT INTO categories (id, name, description, created_at, updated_at) "
+            "VALUES (:category, 'Books', 'All books', now(), now());"
+            "INSERT INTO products (id, name, description, stock, price, is_active, "
+            "created_at, updated_at, category_id) VALUES "
+            "(:book, 'Book', 'A book', 3, 12.5, true, now(), now(), :category),"
+            "(:pen, 'Pen', 'A pen', 10, 2, true, now(), now(), :category);"
+            "INSERT INTO carts (id, user_id, created_at, updated_at, is_active, "
+            "is_checked_out) VALUES (:cart, :user, now(), now(), true, false);"
+            "INSERT INTO cart_items (id, cart_id, product_id, quantity, "
+            "price_snapshot, created_at, updated_at) VALUES "
+            "(gen_random_uuid(), :cart, :book, 2, 12.5, now(), now()),"
+            "(gen_random_uuid(), :cart, :pen, 5, 2, now(), now())"
+        ),
+        ids,
+    )
+    session.commit()
+    return ids
+
+
+def _checkout(run_db, cart_id, address_id):
+    return run_db(
+        lambda db: CheckoutService(db).checkout(
+            cart_id, CheckoutCreate(shipping_address_id=address_id)
+        )
+    )
+
+
+def _stock(session):
+    rows = session.execute(text("SELECT name, stock FROM products")).all()
+    return dict(rows)
+
+
+def test_checkout_creates_order_and_reserves_stock(cart, session, run_db):
+    order = _checkout(run_db, cart["cart"], cart["address"])
+
+    assert order.user_id == cart["user"]
+    assert order.total_price == Decimal("35.00")
+    assert {(item.product_id, item.quantity) for item in order.items} == {
+        (cart["book"], 2),
+        (cart["pen"], 5),
+    }
+    assert _stock(session) == {"Book": 1, "Pen": 5}
+    stored = session.execute(
+        text("SELECT total_price, billing_address_id FROM orders")
+    ).one()
+    assert stored == (Decimal("35.00"), cart["address"])
+
+
+def test_checkout_twice_is_rejected(cart, run_db):
+    _checkout(run_db, cart["cart"], cart["address"])
+
+    with pytest.raises(HTTPException) as exc_info:
+        _checkout(run_db, cart["cart"], cart["address"])
+
+    assert exc_info.value.status_code == 404
+
+
+def test_checkout_with_insufficient_stock_changes_nothing(cart, session, run_db):
+    session.execute(
+        text("UPDATE products SET stock = 1 WHERE id = :id"), {"id": cart["book"]}
+    )
+    session.commit()
+
+    with pytest.raises(HTTPException) as exc_info:
+        _checkout(run_db, cart["cart"], cart["address"])
+
+    assert exc_info.value.status_code == 409
+    assert str(cart["book"]) in exc_info.value.detail
+    assert _stock(session) == {"Book": 1, "Pen": 10}
+    assert session.execute(text("SELECT count(*) FROM orders")).scalar() == 0
+    is_checked_out = session.execute(
+        text("SELECT is_checked_out FROM carts WHERE id = :id"), {"id": cart["cart"]}
+    ).scalar()
+    assert is_checked_out is False
+
+
+def test_checkout_rejects_address_of_another_user(cart, run_db):
+    with pytest.raises(HTTPException) as exc_info:
+        _checkout(run_db, cart["cart"], uuid.uuid4())
+
+    assert exc_info.value.detail == "Shipping address not found"
@@ -0,0 +1,113 @@
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.cache import InMemoryCache
+from app.schema.cart_item import CartItemCreate
+from app.schema.category import CategoryUpdate
+from app.schema.product import ProductUpdate
+from app.services.cart import CartService
+from app.services.cart_item import CartItemService
+from app.services.category import CategoryService
+from app.services.product import ProductService
+
+
+@pytest.fixture()
+def catalog(session):
+    ids = {name: uuid.uuid4() for name in ("user", "category", "product", "cart")}
+    session.execute(text("TRUNCATE TABLE categories CASCADE"))
+    session.execute(
+        text(
+            "INSERT INTO users (id, email, full_name, hashed_password, is_active, "
+            "is_superuser, created_at, updated_at) "
+            "VALUES (:user, 'etag@example.com', 'Etag', 'x', true, false, "
+            "now(), now());"
+            "INSERT INTO categories (id, name, description, created_at, updated_at) "
+            "VALUES (:category, 'Books', 'All books', now(), now());"
+            "INSERT INTO products (id, name, description, stock, price, is_active, "
+            "created_at, updated_at, category_id) "
+            "VALUES (:product, 'Book', 'A book', 10, 12.5, true, now(), now(), "
+            ":category);"
+            "INSERT INTO carts (id, user_id, created_at, updated_at, is_active, "
+            "is_checked_out) VALUES (:cart, :user, now(), now(), true, false)"
+        ),
+        ids,
+    )
+    session.commit()
+    return ids
+
+
+def test_product_version_moves_with_product_and_category_updates(catalog, run_db):
+    cache = InMemoryCache()
+
+    def version(db):
+        return ProductService(db, cache).get_product_version(catalog["product"])
+
+    initial = run_db(version)
+    run_db(
+        lambda db: ProductService(db, cache).update_product(
+            catalog["product"], ProductUpdate(stock=3)
+        )
+    )
+    after_product = run_db(version)
+    run_db(
+        lambda db: CategoryService(db).update_category(
+            catalog["category"], CategoryUpdate(description="Paper")
+        )
+    )
+    after_category = run_db(version)
+
+    assert len({initial, after_product, after_category}) == 3
+
+
+def test_product_read_skips_cached_body_older_than_version(catalog, run_db):
+    cache = InMemoryCache()
+
+    async def read(db):
+        service = ProductService(db, cache)
+        version = await service.get_product_version(catalog["product"])
+        return await service.get_product_by_id(catalog["product"], version)
+
+    assert run_db(read).category.description == "All books"
+    run_db(
+        lambda db: CategoryService(db).update_category(
+            catalog["category"], CategoryUpdate(description="Paper")
+        )
+    )
+
+    assert run_db(read).category.description == "Paper"
+
+
+def test_category_list_version_moves_with_new_category(catalog, session, run_db):
+    initial = run_db(lambda db: CategoryService(db).get_categories_version())
+    session.execute(
+        text(
+            "INSERT INTO categories (id, name, description, created_at, updated_at) "
+            "VALUES (gen_random_uuid(), 'Toys', 'All toys', now(), now())"
+        )
+    )
+    session.commit()
+
+    assert run_db(lambda db: CategoryService(db).get_categories_version()) != initial
+
+
+def test_cart_version_moves_when_items_change(catalog, run_db):
+    def version(db):
+        return CartService(db).get_cart_version(catalog["user"])
+
+    initial = run_db(version)
+    run_db(
+        lambda db: CartItemService(db).create_cart_item(
+            CartItemCreate(
+                cart_id=catalog["cart"],
+                product_id=catalog["product"],
+                quantity=1,
+                price_snapshot=12.5,
+            )
+        )
+    )
+
+    assert run_db(version) != initial
+    cart = run_db(lambda db: CartService(db).get_cart_by_user_id(catalog["user"]))
+    assert cart.items[0].product.category.name == "Books"
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.services.product_import import ProductImportService, iter_lines
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+def test_iter_lines_joins_lines_split_across_chunks():
+    lines = asyncio.run(_collect(iter_lines(_chunks(b"ab", b"c\r\nd", b"e\n", b"f"))))
+
+    assert lines == ["abc", "de", "f"]
+
+
+def _import(run_db, body: bytes, content_type: str):
+    async def operation(db):
+        result = await ProductImportService(db).import_products(
+            _chunks(body), content_type
+        )
+        return result, await db.scalar(text("SELECT count(*) FROM products"))
+
+    return run_db(operation)
+
+
+@pytest.fixture()
+def category_id(session):
+    category_id = uuid.uuid4()
+    session.execute(text("TRUNCATE TABLE categories CASCADE"))
+    session.execute(
+        text(
+            "INSERT INTO categories (id, name, description, created_at, updated_at) "
+            "VALUES (:id, 'Books', 'All books', now(), now())"
+        ),
+        {"id": category_id},
+    )
+    session.commit()
+    return category_id
+
+
+def test_import_ndjson_reports_row_errors_and_inserts_valid_rows(category_id, run_db):
+    rows = [
+        {"name": "Book one", "stock": 3, "price": 9.5, "category_id": str(category_id)},
+        "not json",
+        {"name": "B", "stock": 1, "price": 1, "category_id": str(category_id)},
+        {"name": "Orphan", "stock": 1, "price": 1, "category_id": str(uuid.uuid4())},
+        {"name": "Book two", "stock": 1, "price": 4, "category_id": str(category_id)},
+    ]
+    body = "\n".join(r if isinstance(r, str) else json.dumps(r) for r in rows)
+
+    result, count = _import(run_db, body.encode(), "application/x-ndjson")
+
+    assert result.inserted == 2
+    assert result.failed == 3
+    assert [error.row for error in result.errors] == [2, 3, 4]
+    assert result.errors[2].detail == "Category not found"
+    assert count == 2
+
+
+def test_import_csv_treats_empty_cells_as_missing(category_id, run_db):
+    body = (
+        "name,description,stock,price,is_active,category_id\n"
+        f"Book one,,3,9.5,true,{category_id}\n"
+        f'Book two,"Long, quoted",1,4,false,{category_id}\n'
+        "Broken,row\n"
+    )
+
+    result, count = _import(run_db, body.encode(), "text/csv; charset=utf-8")
+
+    assert result.inserted == 2
+    assert result.errors[0].row == 4
+    assert count == 2
+
+
+def test_import_csv_keeps_quoted_multi_line_fields_together(
+    category_id, session, run_db
+):
+    body = (
+        "name,description,stock,price,is_active,category_id\r\n"
+        f'Book one,"First line\r\nsecond, with ""quotes""",3,9.5,true,{category_id}\r\n'
+        f"Book two,,1,4,true,{category_id}\r\n"
+        "Broken,row\r\n"
+    )
+
+    result, count = _import(run_db, body.encode(), "text/csv")
+
+    assert result.inserted == 2
+    assert [error.row for error in result.errors] == [5]
+    assert count == 2
+    description = session.scalar(
+        text("SELECT description FROM products WHERE name = 'Book one'")
+    )
+    assert description == 'First line\nsecond, with "quotes"'
+
+
+def test_import_rejects_unknown_content_type(run_db):
+    with pytest.raises(ValueError):
+        _import(run_db, b"{}", "application/json")
@@ -0,0 +1,108 @@
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.cache import InMemoryCache
+from app.db.query_counter import count_queries
+from app.schema.product import ProductFilter, ProductSort, SortOrder
+from app.services.product import PRODUCT_PRICE_FACETS, ProductService
+
+
+@pytest.fixture()
+def catalog(session):
+    ids = {name: uuid.uuid4() for name in ("books", "toys")}
+    session.execute(text("TRUNCATE TABLE categories CASCADE"))
+    session.execute(
+        text(
+            "INSERT INTO categories (id, name, description, created_at, updated_at) "
+            "VALUES (:books, 'Books', 'All books', now(), now()),"
+            "(:toys, 'Toys', 'All toys', now(), now());"
+            "INSERT INTO products (id, name, description, stock, price, is_active, "
+            "created_at, updated_at, category_id) VALUES "
+            "(gen_random_uuid(), 'Atlas', 'Maps', 3, 40, true, now(), now(), :books),"
+            "(gen_random_uuid(), 'Novel', 'Story', 0, 12, true, now(), now(), :books),"
+            "(gen_random_uuid(), 'Poems', 'Verse', 1, 5, false, now(), now(), :books),"
+            "(gen_random_uuid(), 'Kite', 'Flies', 2, 12, true, now(), now(), :toys),"
+            "(gen_random_uuid(), 'Robot', 'Beeps', 4, 300, true, now(), now(), :toys)"
+        ),
+        ids,
+    )
+    session.commit()
+    return ids
+
+
+def _run(run_db, operation):
+    return run_db(lambda db: operation(ProductService(db, InMemoryCache())))
+
+
+def _collect(run_db, filters, sort, order, limit=2):
+    async def operation(service):
+        names, cursor = [], None
+        while True:
+            page = await service.list_products(limit, cursor, filters, sort, order)
+            names.extend(product.name for product in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                return names
+
+    return _run(run_db, operation)
+
+
+def test_list_products_sorts_by_price_descending_across_pages(catalog, run_db):
+    names = _collect(
+        run_db, ProductFilter(is_active=True), ProductSort.PRICE, SortOrder.DESC
+    )
+
+    assert names[:2] == ["Robot", "Atlas"]
+    assert sorted(names[2:]) == ["Kite", "Novel"]
+
+
+def test_list_products_applies_all_filters(catalog, run_db):
+    filters = ProductFilter(
+        category_id=catalog["books"], min_price=10, max_price=50, in_stock=True
+    )
+
+    assert _collect(run_db, filters, ProductSort.PRICE, SortOrder.ASC) == ["Atlas"]
+
+
+def test_list_products_rejects_cursor_for_another_sort(catalog, run_db):
+    async def operation(service):
+        page = await service.list_products(1)
+        await service.list_products(1, page.next_cursor, sort=ProductSort.PRICE)
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _run(run_db, operation)
+
+
+def test_product_filter_rejects_inverted_price_range():
+    with pytest.raises(ValueError):
+        ProductFilter(min_price=10, max_price=5)
+
+
+def test_facets_exclude_their_own_filter(catalog, run_db):
+    filters = ProductFilter(category_id=catalog["books"], max_price=20)
+
+    facets = _run(run_db, lambda service: service.get_facets(filters))
+
+    assert [(facet.name, facet.count) for facet in facets.categories] == [
+        ("Books", 2),
+        ("Toys", 1),
+    ]
+    assert facets.total == 2
+    assert len(facets.price_ranges) == len(PRODUCT_PRICE_FACETS) + 1
+    assert [facet.count for facet in facets.price_ranges] == [1, 1, 1, 0, 0, 0]
+    assert facets.price_ranges[0].min_price is None
+    assert facets.price_ranges[-1].max_price is None
+
+
+def test_list_products_query_count_does_not_grow_with_rows(catalog, run_db):
+    async def operation(service):
+        counts = []
+        for limit in (1, 50):
+            with count_queries() as stats:
+                await service.list_products(limit)
+            counts.append(stats.count)
+        return counts
+
+    assert _run(run_db, operation) == [2, 2]
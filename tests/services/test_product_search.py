@@ -0,0 +1,63 @@
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+from app.cache import InMemoryCache
+from app.services.product import ProductService
+
+
+@pytest.fixture()
+def catalog(session):
+    ids = {name: uuid.uuid4() for name in ("books", "toys")}
+    session.execute(text("TRUNCATE TABLE categories CASCADE"))
+    session.execute(
+        text(
+            "INSERT INTO categories (id, name, description, created_at, updated_at) "
+            "VALUES (:books, 'Books', 'All books', now(), now()),"
+            "(:toys, 'Toys', 'All toys', now(), now());"
+            "INSERT INTO products (id, name, description, stock, price, is_active, "
+            "created_at, updated_at, category_id) VALUES "
+            "(gen_random_uuid(), 'Red dragon', 'A novel', 1, 10, true, now(), "
+            "now(), :books),"
+            "(gen_random_uuid(), 'Atlas', 'Maps with a red dragon', 1, 10, true, "
+            "now(), now(), :books),"
+            "(gen_random_uuid(), 'Dragon plush', 'Soft toy', 1, 10, true, now(), "
+            "now(), :toys),"
+            "(gen_random_uuid(), 'Teddy bear', 'Soft toy', 1, 10, true, now(), "
+            "now(), :toys)"
+        ),
+        ids,
+    )
+    session.commit()
+    return ids
+
+
+def _search(run_db, query, limit=20, cursor=None, category_id=None):
+    return run_db(
+        lambda db: ProductService(db, InMemoryCache()).search_products(
+            query, limit, cursor, category_id
+        )
+    )
+
+
+def test_search_ranks_name_matches_above_description_matches(catalog, run_db):
+    page = _search(run_db, "red dragon")
+
+    assert [product.name for product in page.items] == ["Red dragon", "Atlas"]
+    assert page.items[0].category.name == "Books"
+
+
+def test_search_filters_by_category_and_pages_with_cursor(catalog, run_db):
+    first = _search(run_db, "dragon", limit=1, category_id=catalog["books"])
+    second = _search(run_db, "dragon", limit=1, cursor=first.next_cursor)
+
+    assert [product.name for product in first.items] == ["Red dragon"]
+    assert len(second.items) == 1
+    assert _search(run_db, "dragon -plush").next_cursor is None
+    assert _search(run_db, "unicorn").items == []
+
+
+def test_search_rejects_invalid_cursor(catalog, run_db):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _search(run_db, "dragon", cursor="WyJ4Il0")
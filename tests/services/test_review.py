@@ -0,0 +1,247 @@
+import asyncio
+import uuid
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import InMemoryCache
+from app.commands.backfill_ratings import backfill_rating_aggregates
+from app.db.query_counter import count_queries
+from app.models import Product, Review
+from app.models.review import rating_star
+from app.schema.review import ReviewCreate, ReviewSort, ReviewUpdate
+from app.services.product import product_cache_key
+from app.services.review import ReviewService
+
+
+@pytest.fixture()
+def product(session):
+    ids = {name: uuid.uuid4() for name in ("user", "category", "product")}
+    session.execute(text("TRUNCATE TABLE categories CASCADE"))
+    session.execute(
+        text(
+            "INSERT INTO users (id, email, full_name, hashed_password, is_active, "
+            "is_superuser, created_at, updated_at) "
+            "VALUES (:user, 'reviewer@example.com', 'Reviewer', 'x', true, false, "
+            "now(), now());"
+            "INSERT INTO categories (id, name, description, created_at, updated_at) "
+            "VALUES (:category, 'Books', 'All books', now(), now());"
+            "INSERT INTO products (id, name, description, stock, price, is_active, "
+            "created_at, updated_at, category_id) "
+            "VALUES (:product, 'Book', 'A book', 10, 12.5, true, now(), now(), "
+            ":category)"
+        ),
+        ids,
+    )
+    session.commit()
+    return ids
+
+
+def _aggregates(session, product_id):
+    session.expire_all()
+    product = session.get(Product, product_id)
+    return product.rating_count, product.rating_sum, product.rating_histogram
+
+
+def test_rating_star_rounds_to_nearest_star():
+    assert [rating_star(r) for r in (1.0, 1.49, 1.5, 4.4, 5.0)] == [1, 1, 2, 4, 5]
+
+
+def test_review_writes_maintain_product_rating_aggregates(
+    product, session, run_db, run_async
+):
+    cache = InMemoryCache()
+    key = product_cache_key(product["product"])
+
+    def create(rating):
+        return lambda db: ReviewService(db, cache).create_review(
+            ReviewCreate(
+                product_id=product["product"], user_id=product["user"], rating=rating
+            )
+        )
+
+    first = run_db(create(4.0))
+    run_db(create(2.0))
+    assert _aggregates(session, product["product"]) == (2, 6.0, [0, 1, 0, 1, 0])
+
+    run_async(cache.set(key, b"stale", 60))
+    run_db(
+        lambda db: ReviewService(db, cache).update_review(
+            first.id, ReviewUpdate(rating=5.0)
+        )
+    )
+    assert _aggregates(session, product["product"]) == (2, 7.0, [0, 1, 0, 0, 1])
+    assert run_async(cache.get(key)) is None
+
+    run_db(lambda db: ReviewService(db, cache).delete_review(first.id))
+    assert _aggregates(session, product["product"]) == (1, 2.0, [0, 1, 0, 0, 0])
+
+
+@pytest.fixture()
+def run_concurrently(async_engine, run_async):
+    def run(*operations):
+        async def scenario():
+            sessions = [
+                AsyncSession(async_engine, expire_on_commit=False) for _ in operations
+            ]
+            try:
+                return await asyncio.gather(
+                    *(op(db) for op, db in zip(operations, sessions)),
+                    return_exceptions=True,
+                )
+            finally:
+                for db in sessions:
+                    await db.close()
+
+        return run_async(scenario())
+
+    return run
+
+
+def test_concurrent_review_writes_keep_aggregates_consistent(
+    product, session, run_db, run_concurrently
+):
+    cache = InMemoryCache()
+    review = run_db(
+        lambda db: ReviewService(db, cache).create_review(
+            ReviewCreate(
+                product_id=product["product"], user_id=product["user"], rating=4.0
+            )
+        )
+    )
+
+    def update(rating):
+        return lambda db: ReviewService(db, cache).update_review(
+            review.id, ReviewUpdate(rating=rating)
+        )
+
+    run_concurrently(update(5.0), update(1.0))
+    session.expire_all()
+    final = session.get(Review, review.id).rating
+    histogram = [0] * 5
+    histogram[rating_star(final) - 1] = 1
+    assert _aggregates(session, product["product"]) == (1, final, histogram)
+
+    def delete(db):
+        return ReviewService(db, cache).delete_review(review.id)
+
+    results = run_concurrently(delete, delete)
+    assert sum(isinstance(result, HTTPException) for result in results) == 1
+    assert _aggregates(session, product["product"]) == (0, 0.0, [0, 0, 0, 0, 0])
+
+
+def test_create_review_is_built_from_returned_columns(product, session, run_db):
+    async def operation(db):
+        with count_queries() as stats:
+            review = await ReviewService(db, InMemoryCache()).create_review(
+                ReviewCreate(
+                    product_id=product["product"], user_id=product["user"], rating=4.0
+                )
+            )
+        return review, stats
+
+    review, stats = run_db(operation)
+
+    assert stats.count == 2
+    assert any("RETURNING reviews.id" in statement for statement in stats.statements)
+    assert review.created_at is not None
+    assert review.updated_at == review.created_at
+
+
+@pytest.mark.parametrize(
+    "override, message",
+    [("product", "Product with id .* does not exist"), ("user", "User with id")],
+)
+def test_create_review_for_unknown_reference_writes_nothing(
+    product, session, override, message, run_db
+):
+    ids = {**product, override: uuid.uuid4()}
+
+    with pytest.raises(ValueError, match=message):
+        run_db(
+            lambda db: ReviewService(db, InMemoryCache()).create_review(
+                ReviewCreate(product_id=ids["product"], user_id=ids["user"], rating=3.0)
+            )
+        )
+
+    assert session.query(Review).count() == 0
+    assert _aggregates(session, product["product"]) == (0, 0.0, [0, 0, 0, 0, 0])
+
+
+def test_backfill_recomputes_aggregates_from_reviews(product, session, run_db):
+    session.execute(
+        text(
+            "INSERT INTO reviews (id, product_id, user_id, rating, created_at, "
+            "updated_at) SELECT gen_random_uuid(), :product, :user, rating, now(), "
+            "now() FROM unnest(ARRAY[1.0, 2.5, 4.9]) AS rating"
+        ),
+        product,
+    )
+    session.commit()
+
+    updated = run_db(backfill_rating_aggregates)
+
+    assert updated == 1
+    assert _aggregates(session, product["product"]) == (3, 8.4, [1, 0, 1, 0, 1])
+    assert session.get(Product, product["product"]).rating_average == 2.8
+
+
+def _seed_reviews(session, product, ratings):
+    session.execute(
+        text(
+            "INSERT INTO reviews (id, product_id, user_id, rating, created_at, "
+            "updated_at) SELECT gen_random_uuid(), :product, :user, rating, "
+            "now() - position * interval '1 minute', now() "
+            "FROM unnest(CAST(:ratings AS float[])) WITH ORDINALITY "
+            "AS t(rating, position)"
+        ),
+        {**product, "ratings": ratings},
+    )
+    session.commit()
+
+
+def _collect_pages(run_db, product_id, sort, limit):
+    async def operation(db):
+        service = ReviewService(db, InMemoryCache())
+        items, cursor = [], None
+        while True:
+            page = await service.list_reviews(product_id, limit, cursor, sort)
+            items.extend(page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                return items
+
+    return run_db(operation)
+
+
+def test_list_reviews_pages_by_created_at_newest_first(product, session, run_db):
+    _seed_reviews(session, product, [5.0, 4.0, 3.0, 2.0, 1.0])
+
+    reviews = _collect_pages(run_db, product["product"], ReviewSort.CREATED_AT, limit=2)
+
+    assert [review.rating for review in reviews] == [5.0, 4.0, 3.0, 2.0, 1.0]
+
+
+def test_list_reviews_pages_by_rating_with_ties(product, session, run_db):
+    _seed_reviews(session, product, [3.0, 5.0, 3.0, 1.0, 3.0])
+
+    reviews = _collect_pages(run_db, product["product"], ReviewSort.RATING, limit=2)
+
+    assert [review.rating for review in reviews] == [5.0, 3.0, 3.0, 3.0, 1.0]
+    assert len({review.id for review in reviews}) == 5
+
+
+def test_list_reviews_rejects_cursor_for_another_sort(product, session, run_db):
+    _seed_reviews(session, product, [5.0, 4.0])
+
+    async def operation(db):
+        service = ReviewService(db, InMemoryCache())
+        page = await service.list_reviews(product["product"], 1)
+        await service.list_reviews(
+            product["product"], 1, page.next_cursor, ReviewSort.RATING
+        )
+
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        run_db(operation)
@@ -0,0 +1,131 @@
+import pytest
+from sqlalchemy import event, func, select, text
+
+from app.db.query_counter import count_queries
+from app.db.unit_of_work import UnitOfWork
+from app.models import Address, Category, User
+from app.schema.address import AddressCreate
+from app.schema.cart import CartCreate
+from app.schema.category import CategoryCreate
+from app.schema.user import UserCreate
+from app.services.cart import CartService
+from app.services.category import CategoryService
+from app.services.user import UserService
+
+
+@pytest.fixture(autouse=True)
+def _clean_categories(session):
+    session.execute(text("TRUNCATE TABLE categories CASCADE"))
+    session.commit()
+
+
+@pytest.fixture()
+def run_counted(async_engine, run_db):
+    commits = []
+    event.listen(async_engine.sync_engine, "commit", lambda conn: commits.append(conn))
+
+    def run(operation):
+        commits.clear()
+        with count_queries() as stats:
+            result = run_db(operation)
+        return result, stats.count, len(commits)
+
+    return run
+
+
+def _count(session, model):
+    return session.scalar(select(func.count()).select_from(model))
+
+
+def _user(email="buyer@example.com", addresses=3):
+    return UserCreate(
+        email=email,
+        full_name="Buyer",
+        password={"raw": "Secret#123"},
+        addresses=[
+            AddressCreate(
+                street=f"Street {index}",
+                city="City",
+                state="State",
+                country="Country",
+                postal_code="12345-678",
+            )
+            for index in range(addresses)
+        ],
+    )
+
+
+def test_unit_of_work_commits_once_and_nested_blocks_join(run_counted):
+    async def operation(db):
+        async with UnitOfWork(db):
+            db.add(Category(name="Books", description="All books"))
+            async with UnitOfWork(db):
+                db.add(Category(name="Toys", description="All toys"))
+            assert db.in_transaction()
+
+    _, _, commits = run_counted(operation)
+
+    assert commits == 1
+
+
+def test_unit_of_work_rolls_back_on_error(session, run_counted):
+    async def operation(db):
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(db):
+                db.add(Category(name="Books", description="All books"))
+                await db.flush()
+                raise RuntimeError("boom")
+
+    _, _, commits = run_counted(operation)
+
+    assert commits == 0
+    assert _count(session, Category) == 0
+
+
+def test_create_user_with_addresses_is_one_transaction(session, run_counted):
+    user, statements, commits = run_counted(
+        lambda db: UserService(db).create_user_with_addresses(_user())
+    )
+
+    assert len(user.addresses) == 3
+    assert all(address.id and address.created_at for address in user.addresses)
+    assert commits == 1
+    assert statements == 4
+    assert _count(session, Address) == 3
+
+
+def test_create_user_with_duplicate_email_writes_nothing(session, run_counted):
+    run_counted(
+        lambda db: UserService(db).create_user_with_addresses(_user(addresses=0))
+    )
+
+    with pytest.raises(ValueError, match="Email already exists"):
+        run_counted(lambda db: UserService(db).create_user_with_addresses(_user()))
+
+    assert _count(session, User) == 1
+    assert _count(session, Address) == 0
+
+
+def test_create_category_is_one_statement_and_commit(run_counted):
+    category, statements, commits = run_counted(
+        lambda db: CategoryService(db).create_category(
+            CategoryCreate(name="Books", description="All books")
+        )
+    )
+
+    assert category.name == "Books"
+    assert (statements, commits) == (1, 1)
+
+
+def test_create_cart_is_existence_check_and_insert(session, run_counted):
+    user, _, _ = run_counted(
+        lambda db: UserService(db).create_user_with_addresses(_user(addresses=0))
+    )
+
+    cart, statements, commits = run_counted(
+        lambda db: CartService(db).create_cart(CartCreate(user_id=user.id))
+    )
+
+    assert cart.items == []
+    assert cart.created_at is not None
+    assert (statements, commits) == (2, 1)
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from app import __main__ as cli
+
+
+@pytest.fixture()
+def uvicorn_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        cli.uvicorn, "run", lambda app, **options: calls.append((app, options))
+    )
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", "")
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR")
+    return calls
+
+
+def test_serve_defaults_to_one_worker_per_usable_cpu(monkeypatch, uvicorn_calls):
+    monkeypatch.setattr(cli, "WEB_CONCURRENCY", None)
+    monkeypatch.setattr(cli, "cpu_count", lambda: 1)
+
+    cli.main(["serve"])
+
+    app, options = uvicorn_calls[0]
+    assert app == "app.main:app"
+    assert options["workers"] == 1
+    assert (options["loop"], options["http"]) == ("uvloop", "httptools")
+    assert options["lifespan"] == "on"
+    assert "PROMETHEUS_MULTIPROC_DIR" not in os.environ
+
+
+def test_serve_shares_a_clean_metrics_dir_between_workers(
+    tmp_path, monkeypatch, uvicorn_calls
+):
+    stale = tmp_path / "metrics"
+    stale.mkdir()
+    (stale / "counter_1.db").write_bytes(b"stale")
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(stale))
+
+    cli.main(["serve", "--workers", "3", "--port", "9000"])
+
+    assert uvicorn_calls[0][1]["workers"] == 3
+    assert uvicorn_calls[0][1]["port"] == 9000
+    assert list(stale.iterdir()) == []
+
+
+def test_serve_creates_a_metrics_dir_for_multiple_workers(uvicorn_calls):
+    cli.main(["serve", "--workers", "2"])
+
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    assert os.path.isdir(directory)
+    os.rmdir(directory)
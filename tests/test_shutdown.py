@@ -0,0 +1,36 @@
+import asyncio
+
+from sqlalchemy import event
+
+from app.configs import logger as logger_module
+from app.configs.logger import add_file_sink
+from app.db import session
+from app.models.value_objects import password
+from app.models.value_objects.password import Password
+from app.shutdown import shutdown
+
+
+def test_shutdown_releases_engines_executor_and_log_sinks(tmp_path, monkeypatch):
+    log_file = tmp_path / "app.log"
+    monkeypatch.setattr(logger_module, "LOG_FILE", str(log_file))
+
+    async def scenario():
+        add_file_sink()
+        await Password(raw="Secret#123").hash_async()
+        session.init_engines()
+        closed = []
+        event.listen(
+            session.engine.sync_engine, "close", lambda *args: closed.append(args)
+        )
+        async with session.engine.connect():
+            pass
+        await shutdown()
+        return closed
+
+    closed = asyncio.run(scenario())
+
+    assert session.engine is None
+    assert len(closed) == 1
+    assert password._executor is None
+    assert logger_module._file_sink is None
+    assert "Shutdown completed" in log_file.read_text()